@@ -0,0 +1,442 @@
+# Self-hosted asset bundle for the report.
+#
+# The report used to pull the Tailwind Play CDN (a JIT compiler that generates
+# CSS in the browser on every load), Chart.js from jsDelivr and Inter from
+# Google Fonts. This module is both the build step that produces a local
+# replacement for all three and the loader that inlines it into the page:
+#
+#     python assets.py            # rebuild everything under assets/
+#     python assets.py css        # only the purged Tailwind stylesheet
+#
+# - assets/tailwind.min.css: minified Tailwind utilities for exactly the
+#   classes used by the report. Generated in pure Python, no Node toolchain.
+# - assets/vendor/chart.umd.js: a pinned Chart.js build.
+# - assets/fonts/inter-<weight>.woff2: the four Inter weights the report uses,
+#   cut down to the characters it needs (needs requirements-build.txt).
+#
+# Chart.js and Inter are taken from a pinned django-unfold wheel on PyPI, which
+# vendors both (their MIT and OFL licences are copied next to the files). The
+# wheel is checked against the SHA-256 PyPI publishes for it, recorded in
+# assets/SHA256SUMS, and the vendored Chart.js is checked against its own
+# digest there before it is inlined into a page. The files are committed, so
+# the assets/ folder works in air-gapped deployments; `python assets.py
+# chartjs font` only needs the network to move to a new version, and `--pin`
+# records the digests of a new wheel (compare it with PyPI's before
+# committing). A checkout without the vendored files refuses to render rather
+# than quietly loading them from a CDN; REPORT_ALLOW_CDN=1 allows that for
+# development on a connected machine.
+
+import base64
+import functools
+import hashlib
+import io
+import os
+import re
+import sys
+import urllib.request
+import zipfile
+from html import unescape
+from pathlib import Path
+
+ASSET_DIR = Path(__file__).resolve().parent / "assets"
+TAILWIND_CSS = ASSET_DIR / "tailwind.min.css"
+CHART_JS = ASSET_DIR / "vendor" / "chart.umd.js"
+CHECKSUMS = ASSET_DIR / "SHA256SUMS"
+ALLOW_CDN = os.environ.get("REPORT_ALLOW_CDN") == "1"
+
+SOURCE_WHEEL = "django_unfold-0.91.0-py3-none-any.whl"
+SOURCE_URL = ("https://files.pythonhosted.org/packages/cb/e8/"
+              "2591119368628867284550ee5c337bae1f4b4c0e5a8a59f231899326a26f/" + SOURCE_WHEEL)
+_STATIC = "unfold/static/unfold/"
+
+CHART_JS_VERSION = "4.4.0"
+CHART_JS_MEMBER = _STATIC + "js/chart/chart.js"
+CHART_JS_PIN = f"chart.js-{CHART_JS_VERSION}/chart.umd.js"
+CHART_JS_URL = f"https://cdn.jsdelivr.net/npm/chart.js@{CHART_JS_VERSION}/dist/chart.umd.js"  # REPORT_ALLOW_CDN only
+INTER_VERSION = "4.001"
+INTER_MEMBERS = {400: "Regular", 500: "Medium", 600: "SemiBold", 700: "Bold"}
+INTER_FONTS = {weight: ASSET_DIR / "fonts" / f"inter-{weight}.woff2" for weight in INTER_MEMBERS}
+LICENSES = {_STATIC + "js/chart/LICENSE": CHART_JS.parent / "chart.js.LICENSE",
+            _STATIC + "fonts/inter/LICENSE": ASSET_DIR / "fonts" / "inter.LICENSE"}
+
+# --- Tailwind purge -----------------------------------------------------------
+#
+# A small subset of Tailwind v3: the preflight reset plus the utility families
+# the report actually uses. Classes we don't know how to generate are reported
+# by the build so they can be added here.
+
+SCREENS = {"sm": 640, "md": 768, "lg": 1024, "xl": 1280, "2xl": 1536}
+
+SPACING = {"0": "0px", "px": "1px", "0.5": "0.125rem", "1": "0.25rem", "1.5": "0.375rem",
+           "2": "0.5rem", "2.5": "0.625rem", "3": "0.75rem", "3.5": "0.875rem", "4": "1rem",
+           "5": "1.25rem", "6": "1.5rem", "7": "1.75rem", "8": "2rem", "9": "2.25rem",
+           "10": "2.5rem", "11": "2.75rem", "12": "3rem", "14": "3.5rem", "16": "4rem",
+           "20": "5rem", "24": "6rem", "auto": "auto", "full": "100%"}
+
+COLORS = {
+    "white": "255 255 255", "black": "0 0 0",
+    "gray-50": "249 250 251", "gray-100": "243 244 246", "gray-200": "229 231 235",
+    "gray-300": "209 213 219", "gray-400": "156 163 175", "gray-500": "107 114 128",
+    "gray-600": "75 85 99", "gray-700": "55 65 81", "gray-800": "31 41 55",
+    "gray-900": "17 24 39",
+    "blue-50": "239 246 255", "blue-100": "219 234 254", "blue-200": "191 219 254",
+    "blue-300": "147 197 253", "blue-400": "96 165 250", "blue-500": "59 130 246",
+    "blue-600": "37 99 235", "blue-700": "29 78 216", "blue-800": "30 64 175",
+    "blue-900": "30 58 138",
+}
+
+FONT_SIZES = {"xs": ("0.75rem", "1rem"), "sm": ("0.875rem", "1.25rem"),
+              "base": ("1rem", "1.5rem"), "lg": ("1.125rem", "1.75rem"),
+              "xl": ("1.25rem", "1.75rem"), "2xl": ("1.5rem", "2rem"),
+              "3xl": ("1.875rem", "2.25rem"), "4xl": ("2.25rem", "2.5rem"),
+              "5xl": ("3rem", "1")}
+
+FONT_WEIGHTS = {"normal": 400, "medium": 500, "semibold": 600, "bold": 700}
+
+MAX_WIDTHS = {"md": "28rem", "lg": "32rem", "xl": "36rem", "2xl": "42rem", "3xl": "48rem",
+              "4xl": "56rem", "5xl": "64rem", "full": "100%"}
+
+SHADOWS = {
+    "sm": "0 1px 2px 0 rgb(0 0 0 / 0.05)",
+    "": "0 1px 3px 0 rgb(0 0 0 / 0.1), 0 1px 2px -1px rgb(0 0 0 / 0.1)",
+    "md": "0 4px 6px -1px rgb(0 0 0 / 0.1), 0 2px 4px -2px rgb(0 0 0 / 0.1)",
+    "lg": "0 10px 15px -3px rgb(0 0 0 / 0.1), 0 4px 6px -4px rgb(0 0 0 / 0.1)",
+}
+
+RADII = {"": "0.25rem", "md": "0.375rem", "lg": "0.5rem", "xl": "0.75rem", "full": "9999px"}
+
+BLURS = {"sm": "4px", "": "8px", "md": "12px", "lg": "16px", "xl": "24px"}
+
+STATIC = {
+    "block": "display:block", "inline-block": "display:inline-block", "flex": "display:flex",
+    "grid": "display:grid", "hidden": "display:none",
+    "sticky": "position:sticky", "relative": "position:relative", "absolute": "position:absolute",
+    "items-center": "align-items:center", "justify-between": "justify-content:space-between",
+    "justify-center": "justify-content:center",
+    "text-left": "text-align:left", "text-center": "text-align:center",
+    "whitespace-nowrap": "white-space:nowrap",
+    "list-disc": "list-style-type:disc", "list-decimal": "list-style-type:decimal",
+    "list-inside": "list-style-position:inside",
+    "antialiased": "-webkit-font-smoothing:antialiased;-moz-osx-font-smoothing:grayscale",
+    "border": "border-width:1px", "border-b": "border-bottom-width:1px",
+    "border-b-2": "border-bottom-width:2px",
+    "transform": "transform:rotate(var(--tw-rotate,0))",
+    "transition-transform": "transition-property:transform;"
+                            "transition-timing-function:cubic-bezier(0.4,0,0.2,1);"
+                            "transition-duration:150ms",
+    "outline-none": "outline:2px solid transparent;outline-offset:2px",
+    "overflow-hidden": "overflow:hidden",
+}
+
+PREFLIGHT = (
+    "*,::before,::after{box-sizing:border-box;border-width:0;border-style:solid;border-color:#e5e7eb}"
+    "html{line-height:1.5;-webkit-text-size-adjust:100%;tab-size:4;"
+    "font-family:ui-sans-serif,system-ui,sans-serif}"
+    "body{margin:0;line-height:inherit}"
+    "h1,h2,h3,h4,h5,h6{font-size:inherit;font-weight:inherit}"
+    "a{color:inherit;text-decoration:inherit}"
+    "b,strong{font-weight:bolder}"
+    "sub,sup{font-size:75%;line-height:0;position:relative;vertical-align:baseline}"
+    "sup{top:-0.5em}"
+    "button{font-family:inherit;font-size:100%;font-weight:inherit;line-height:inherit;"
+    "color:inherit;margin:0;padding:0;text-transform:none;background-color:transparent;"
+    "background-image:none;cursor:pointer;-webkit-appearance:button}"
+    "blockquote,dl,dd,h1,h2,h3,h4,h5,h6,hr,figure,p,pre{margin:0}"
+    "ol,ul,menu{list-style:none;margin:0;padding:0}"
+    "img,svg,video,canvas,audio,iframe,embed,object{display:block;vertical-align:middle}"
+    "[hidden]{display:none}"
+)
+
+_SPACING_PROPS = {
+    "m": ("margin",), "mx": ("margin-left", "margin-right"), "my": ("margin-top", "margin-bottom"),
+    "mt": ("margin-top",), "mb": ("margin-bottom",), "ml": ("margin-left",), "mr": ("margin-right",),
+    "p": ("padding",), "px": ("padding-left", "padding-right"), "py": ("padding-top", "padding-bottom"),
+    "pt": ("padding-top",), "pb": ("padding-bottom",), "pl": ("padding-left",), "pr": ("padding-right",),
+    "gap": ("gap",), "w": ("width",), "h": ("height",), "top": ("top",),
+}
+
+
+def _color(value):
+    # "blue-50/50" -> rgb(239 246 255 / 0.5)
+    name, _, alpha = value.partition("/")
+    if name not in COLORS:
+        return None
+    return f"rgb({COLORS[name]} / {int(alpha) / 100 if alpha else 1})"
+
+
+def _declarations(name):
+    """CSS declarations for a bare utility (no variant prefix), or None."""
+    if name in STATIC:
+        return STATIC[name]
+    if name == "container":
+        return "width:100%"
+    negative = name.startswith("-")
+    base = name[1:] if negative else name
+    prefix, _, value = base.rpartition("-")
+    if prefix in _SPACING_PROPS and value in SPACING:
+        amount = SPACING[value]
+        if negative:
+            amount = f"-{amount}"
+        return ";".join(f"{prop}:{amount}" for prop in _SPACING_PROPS[prefix])
+    if prefix in ("space-x", "space-y") and value in SPACING:
+        return None  # handled as a child selector in _rule()
+    if prefix == "grid-cols" and value.isdigit():
+        return f"grid-template-columns:repeat({value},minmax(0,1fr))"
+    if prefix == "max-w" and value in MAX_WIDTHS:
+        return f"max-width:{MAX_WIDTHS[value]}"
+    if prefix == "z" and value.isdigit():
+        return f"z-index:{value}"
+    if prefix == "rotate" and value.isdigit():
+        return f"--tw-rotate:{value}deg;transform:rotate(var(--tw-rotate))"
+    if prefix == "font" and value in FONT_WEIGHTS:
+        return f"font-weight:{FONT_WEIGHTS[value]}"
+    if name in ("shadow", "rounded") or prefix in ("shadow", "rounded", "backdrop-blur"):
+        key = "" if name in ("shadow", "rounded") else value
+        table, prop = {"shadow": (SHADOWS, "box-shadow"), "rounded": (RADII, "border-radius"),
+                       "backdrop-blur": (BLURS, "backdrop-filter")}[prefix or name]
+        if key not in table:
+            return None
+        if prop == "backdrop-filter":
+            return f"-webkit-backdrop-filter:blur({table[key]});backdrop-filter:blur({table[key]})"
+        return f"{prop}:{table[key]}"
+    if base.startswith("text-"):
+        size = base[5:]
+        if size in FONT_SIZES:
+            font_size, line_height = FONT_SIZES[size]
+            return f"font-size:{font_size};line-height:{line_height}"
+        color = _color(size)
+        return color and f"color:{color}"
+    if base.startswith("bg-"):
+        color = _color(base[3:])
+        return color and f"background-color:{color}"
+    if base.startswith("border-"):
+        color = _color(base[7:])
+        return color and f"border-color:{color}"
+    return None
+
+
+def _escape(class_name):
+    return re.sub(r"([:/.\[\]])", r"\\\1", class_name)
+
+
+def _rule(class_name):
+    """Return (screen, css_rule) for one class, or None if it is not a utility."""
+    *variants, name = class_name.split(":")
+    screen = None
+    pseudo = ""
+    for variant in variants:
+        if variant in SCREENS:
+            screen = variant
+        elif variant in ("hover", "focus", "active"):
+            pseudo += f":{variant}"
+        else:
+            return None
+    selector = "." + _escape(class_name) + pseudo
+    prefix, _, value = name.rpartition("-")
+    if prefix in ("space-x", "space-y") and value in SPACING:
+        side = "left" if prefix == "space-x" else "top"
+        selector += ">:not([hidden])~:not([hidden])"
+        return screen, f"{selector}{{margin-{side}:{SPACING[value]}}}"
+    declarations = _declarations(name)
+    if declarations is None:
+        return None
+    return screen, f"{selector}{{{declarations}}}"
+
+
+def used_classes(html):
+    """Every class token in the page, including ones only toggled from JS."""
+    classes = set()
+    for match in re.finditer(r'class="([^"]*)"', html):
+        classes.update(match.group(1).split())
+    for match in re.finditer(r"classList\.(?:add|remove|toggle)\(([^)]*)\)", html):
+        classes.update(re.findall(r"'([^']+)'", match.group(1)))
+    return classes
+
+
+def build_tailwind(html):
+    """Purged, minified Tailwind CSS for the classes in ``html``.
+
+    Returns ``(css, unknown)`` where ``unknown`` lists the classes that are
+    not utilities we can generate (component classes from the page's own
+    <style> block and JS hooks end up here too).
+    """
+    classes = used_classes(html)
+    by_screen = {None: []}
+    unknown = []
+    # Base utilities first, then state variants, then breakpoints in ascending
+    # order so that later rules win exactly as they do in Tailwind.
+    for class_name in sorted(classes, key=lambda c: (c.count(":"), c)):
+        rule = _rule(class_name)
+        if rule is None:
+            unknown.append(class_name)
+            continue
+        screen, css = rule
+        by_screen.setdefault(screen, []).append(css)
+    css = PREFLIGHT + "".join(by_screen.pop(None))
+    for screen, width in SCREENS.items():
+        rules = by_screen.get(screen, [])
+        if "container" in classes:
+            rules.insert(0, f".container{{max-width:{width}px}}")
+        if rules:
+            css += f"@media (min-width:{width}px){{{''.join(rules)}}}"
+    return css, sorted(unknown)
+
+
+# --- Vendored Chart.js and Inter ----------------------------------------------
+
+class AssetError(RuntimeError):
+    pass
+
+
+def _pins():
+    # sha256sum format: "<hex digest>  <name>" per line.
+    if not CHECKSUMS.exists():
+        return {}
+    pins = {}
+    for line in CHECKSUMS.read_text(encoding="utf-8").splitlines():
+        if line.strip() and not line.startswith("#"):
+            digest, name = line.split(maxsplit=1)
+            pins[name.strip()] = digest.lower()
+    return pins
+
+
+def verify(name, data, pin=False):
+    """Return ``data`` if its SHA-256 is the one pinned for ``name``.
+
+    With ``pin``, a name that has no digest yet is recorded instead.
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    expected = _pins().get(name)
+    if expected is None and pin:
+        with CHECKSUMS.open("a", encoding="utf-8") as checksums:
+            checksums.write(f"{digest}  {name}\n")
+        print(f"pinned {name}: {digest}")
+        return data
+    if expected is None:
+        raise AssetError(f"no SHA-256 pinned for {name} in {CHECKSUMS}; "
+                         "check the download and record it with --pin")
+    if digest != expected:
+        raise AssetError(f"{name}: SHA-256 {digest} does not match the pinned {expected}")
+    return data
+
+
+def _download(url, timeout=60):
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        return response.read()
+
+
+@functools.lru_cache(maxsize=1)
+def _source(pin=False):
+    return zipfile.ZipFile(io.BytesIO(verify(SOURCE_WHEEL, _download(SOURCE_URL), pin)))
+
+
+def build_font(html, pin=False):
+    # fontTools is a build-time dependency only (requirements-build.txt).
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+
+    # Every character in the page source (markup, chart labels, the "&times;"
+    # the accordion swaps in) plus printable ASCII for text built at runtime.
+    text = "".join(chr(c) for c in range(0x20, 0x7F)) + unescape(html)
+    for weight, style in INTER_MEMBERS.items():
+        font = TTFont(io.BytesIO(_source(pin).read(f"{_STATIC}fonts/inter/Inter-{style}.woff2")))
+        options = subset.Options()
+        options.flavor = "woff2"
+        subsetter = subset.Subsetter(options)
+        subsetter.populate(text=text)
+        subsetter.subset(font)
+        out = INTER_FONTS[weight]
+        out.parent.mkdir(parents=True, exist_ok=True)
+        font.flavor = "woff2"
+        font.save(out)
+
+
+def _copy_licenses(pin=False):
+    for member, out in LICENSES.items():
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_bytes(_source(pin).read(member))
+
+
+def build(html, targets=("css", "chartjs", "font"), pin=False):
+    ASSET_DIR.mkdir(exist_ok=True)
+    if "css" in targets:
+        css, unknown = build_tailwind(html)
+        TAILWIND_CSS.write_text(css, encoding="utf-8")
+        print(f"wrote {TAILWIND_CSS} ({len(css)} bytes)")
+        print("not generated (component classes / JS hooks):", " ".join(unknown))
+    if "chartjs" in targets:
+        CHART_JS.parent.mkdir(parents=True, exist_ok=True)
+        CHART_JS.write_bytes(verify(CHART_JS_PIN, _source(pin).read(CHART_JS_MEMBER), pin))
+        print(f"wrote {CHART_JS} (Chart.js {CHART_JS_VERSION})")
+    if "font" in targets:
+        build_font(html, pin=pin)
+        size = sum(path.stat().st_size for path in INTER_FONTS.values())
+        print(f"wrote {len(INTER_FONTS)} Inter {INTER_VERSION} weights to {ASSET_DIR / 'fonts'} ({size} bytes)")
+    if "chartjs" in targets or "font" in targets:
+        _copy_licenses(pin)
+
+
+# --- Loader -------------------------------------------------------------------
+
+def font_face(weight, src):
+    return ("@font-face{font-family:'Inter';font-style:normal;"
+            f"font-weight:{weight};font-display:swap;src:url({src}) format('woff2')}}")
+
+
+def _stamp(path):
+    return path.stat().st_mtime_ns if path.exists() else None
+
+
+def require_vendored():
+    """Raise AssetError if Chart.js or Inter isn't vendored, or Chart.js isn't the pinned build.
+
+    Missing files are allowed with REPORT_ALLOW_CDN=1.
+    """
+    missing = [path.relative_to(ASSET_DIR).as_posix()
+               for path in (CHART_JS, *INTER_FONTS.values()) if not path.exists()]
+    if missing and not ALLOW_CDN:
+        raise AssetError(f"not vendored: {', '.join(missing)}. Run `python assets.py chartjs font` on a connected "
+                         "machine and commit the files (or set REPORT_ALLOW_CDN=1 for development)")
+    if CHART_JS.exists():
+        verify(CHART_JS_PIN, CHART_JS.read_bytes())
+
+
+@functools.lru_cache(maxsize=4)
+def _inline_head(css_stamp, chart_stamp, font_stamps, checksums_stamp):
+    require_vendored()
+    tags = []
+    css = TAILWIND_CSS.read_text(encoding="utf-8") if css_stamp else ""
+    fonts = "".join(font_face(weight, "data:font/woff2;base64,"
+                              + base64.b64encode(path.read_bytes()).decode("ascii"))
+                    for (weight, path), stamp in zip(INTER_FONTS.items(), font_stamps) if stamp)
+    tags.append(f"<style>{fonts}{css}</style>")
+    if chart_stamp:
+        # "</script" cannot appear in an inline script; Chart.js doesn't contain
+        # it, but guard anyway so a future build can't break the page.
+        source = CHART_JS.read_text(encoding="utf-8").replace("</script", "<\\/script")
+        tags.append(f'<script id="chart-js">{source}</script>')
+    else:
+        # REPORT_ALLOW_CDN=1 on a checkout without the vendored build.
+        tags.append(f'<script id="chart-js" src="{CHART_JS_URL}" defer></script>')
+    return "\n    ".join(tags)
+
+
+def bundle_stamp():
+    """Changes whenever any file of the bundle is rebuilt."""
+    return (_stamp(TAILWIND_CSS), _stamp(CHART_JS), tuple(_stamp(path) for path in INTER_FONTS.values()),
+            _stamp(CHECKSUMS))
+
+
+def head_tags():
+    """<head> markup that inlines the local bundle into the page."""
+    return _inline_head(*bundle_stamp())
+
+
+if __name__ == "__main__":
+    from report import build_html
+
+    # Scan the rendered page so characters that only appear in the data
+    # (e.g. the rupee sign) make it into the font subset.
+    args = sys.argv[1:]
+    targets = tuple(arg for arg in args if arg != "--pin")
+    build(build_html(head=""), targets=targets or ("css", "chartjs", "font"), pin="--pin" in args)
@@ -0,0 +1,289 @@
+# Benchmarks of the report in a headless browser, with budgets.
+#
+#     pip install -r requirements-bench.txt && playwright install chromium
+#     python benchmark.py                      # compare with the baseline
+#     python benchmark.py --update-baseline    # record a new baseline
+#     python benchmark.py --budget script_ms=10 --budget scroll_ms=30:2
+#     python benchmark.py --chromium /path/to/chrome   # an existing browser build
+#     python benchmark.py --no-browser         # only the sizes and app_rerun_ms
+#
+# The report is exported (export.py) to a temporary folder and served from
+# 127.0.0.1 with the vendored assets; every request to another origin is
+# blocked and fails the run, so nothing depends on the network. Each run
+# loads the page in a fresh headless Chromium context and records:
+#
+#     html_bytes, asset_bytes  size of index.html and of its hashed assets
+#     gzip_bytes               all of them as served gzipped
+#     script_ms                main-thread script time until the first chart
+#     first_chart_ms           navigation start to the first chart created
+#     resize_storm_ms          main-thread time for a burst of window resizes
+#                              with every chart rendered (renderAllCharts)
+#     scroll_ms                main-thread time to scroll the page top to bottom
+#     app_rerun_ms             wall time of one run of the Streamlit script
+#                              (Website.py, in AppTest) once its caches are warm
+#
+# The median over --runs is compared with benchmarks/baseline.json. A metric
+# fails when it exceeds the baseline by more than its budget: a percentage
+# and an absolute slack, whichever allows more (BUDGETS). Any failure prints
+# the table of what moved and exits with status 1. So does a metric with no
+# baseline value, or no baseline at all: a run that can't be compared doesn't
+# pass. Timings depend on the machine, so record the baseline with
+# --update-baseline on the machine that runs the comparison (e.g. in CI) and
+# commit benchmarks/baseline.json. Recording merges into the baseline, so the
+# browser metrics and the rest can be recorded by separate runs.
+
+import argparse
+import contextlib
+import functools
+import json
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import date
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+import assets
+import export
+
+try:
+    from playwright.sync_api import sync_playwright
+except ImportError:  # optional: see requirements-bench.txt
+    sync_playwright = None
+
+ROOT = Path(__file__).resolve().parent
+BASELINE = ROOT / "benchmarks" / "baseline.json"
+APP = ROOT / "Website.py"
+# metric -> (allowed increase in percent, absolute slack in the metric's unit)
+BUDGETS = {
+    "html_bytes": (2, 256),
+    "asset_bytes": (2, 256),
+    "gzip_bytes": (2, 128),
+    "script_ms": (20, 5),
+    "first_chart_ms": (25, 20),
+    "resize_storm_ms": (25, 10),
+    "scroll_ms": (25, 5),
+    "app_rerun_ms": (25, 20),
+}
+VIEWPORT = {"width": 1280, "height": 900}
+RESIZE_STEPS = 30
+SCROLL_STEP_PX = 200
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@contextlib.contextmanager
+def serve(directory):
+    """Serve ``directory`` on a free port of 127.0.0.1; yields its base URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(_QuietHandler, directory=str(directory)))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def export_report(out_dir):
+    # Runs offline, so even REPORT_ALLOW_CDN=1 can't stand in for Chart.js.
+    if not assets.CHART_JS.exists():
+        raise SystemExit("Chart.js is not vendored; run `python assets.py chartjs font` once on a connected machine")
+    try:
+        manifest, _ = export.export_site(out_dir)
+    except assets.AssetError as error:
+        raise SystemExit(f"error: {error}")
+    return manifest
+
+
+def payload_sizes(out_dir, manifest):
+    files = [Path(out_dir) / name for name in manifest.values()]
+    gzipped = [path.with_name(path.name + ".gz") for path in files]
+    return {
+        "html_bytes": (Path(out_dir) / manifest["index.html"]).stat().st_size,
+        "asset_bytes": sum(path.stat().st_size for path in files if path.name != manifest["index.html"]),
+        "gzip_bytes": sum((gz if gz.exists() else path).stat().st_size for path, gz in zip(files, gzipped)),
+    }
+
+
+def _main_thread_ms(cdp, name):
+    metrics = {metric["name"]: metric["value"] for metric in cdp.send("Performance.getMetrics")["metrics"]}
+    return metrics[name] * 1000
+
+
+def measure_page(browser, url):
+    """One cold load of the report; returns its timing metrics."""
+    context = browser.new_context(viewport=VIEWPORT, service_workers="block")
+    offline_violations = []
+
+    def route(request_route):
+        if request_route.request.url.startswith(url):
+            request_route.continue_()
+        else:
+            offline_violations.append(request_route.request.url)
+            request_route.abort()
+
+    context.route("**/*", route)
+    page = context.new_page()
+    cdp = context.new_cdp_session(page)
+    cdp.send("Performance.enable")
+    try:
+        page.goto(url, wait_until="load")
+        # Charts hydrate as they near the viewport; bring the first one in.
+        page.evaluate("document.querySelector('.chart-container').scrollIntoView()")
+        page.wait_for_function("performance.getEntriesByType('measure')"
+                               ".some(entry => entry.name.startsWith('report:chart_render'))")
+        first_chart_ms = page.evaluate("""Math.min(...performance.getEntriesByType('measure')
+            .filter(entry => entry.name.startsWith('report:chart_render'))
+            .map(entry => entry.startTime + entry.duration))""")
+        script_ms = _main_thread_ms(cdp, "ScriptDuration")
+
+        page.evaluate("renderAllCharts()")
+        before = _main_thread_ms(cdp, "TaskDuration")
+        for step in range(RESIZE_STEPS):
+            page.set_viewport_size({"width": VIEWPORT["width"] - (step % 10) * 60, "height": VIEWPORT["height"]})
+        page.set_viewport_size(VIEWPORT)
+        page.wait_for_timeout(500)  # past resizeDelay, so the debounced redraw is counted
+        resize_storm_ms = _main_thread_ms(cdp, "TaskDuration") - before
+
+        page.evaluate("window.scrollTo(0, 0)")
+        before = _main_thread_ms(cdp, "TaskDuration")
+        page.evaluate("""step => new Promise(resolve => {
+            function next() {
+                window.scrollBy(0, step);
+                if (window.scrollY + window.innerHeight < document.documentElement.scrollHeight) {
+                    requestAnimationFrame(next);
+                } else {
+                    resolve();
+                }
+            }
+            requestAnimationFrame(next);
+        })""", SCROLL_STEP_PX)
+        page.wait_for_timeout(100)
+        scroll_ms = _main_thread_ms(cdp, "TaskDuration") - before
+    finally:
+        context.close()
+    if offline_violations:
+        raise SystemExit("the report requested other origins:\n  " + "\n  ".join(sorted(set(offline_violations))))
+    return {"script_ms": script_ms, "first_chart_ms": first_chart_ms,
+            "resize_storm_ms": resize_storm_ms, "scroll_ms": scroll_ms}
+
+
+def _run_app(app):
+    started = time.perf_counter()
+    app.run()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if app.exception:
+        raise SystemExit(f"{APP.name} failed: {app.exception[0].message}")
+    return elapsed_ms
+
+
+def measure_app():
+    """One rerun of Website.py, as a widget change triggers it; returns its timing."""
+    app = AppTest.from_file(str(APP), default_timeout=120)
+    _run_app(app)  # the first run fills the app's caches
+    return {"app_rerun_ms": _run_app(app)}
+
+
+def run(runs, browser=True, executable_path=None):
+    """Median of every metric over ``runs`` cold loads, and the browser version.
+
+    Without ``browser`` only the sizes and the app are measured (version None).
+    """
+    samples, version = [{} for _ in range(runs)], None
+    with tempfile.TemporaryDirectory() as out_dir:
+        manifest = export_report(out_dir)
+        results = payload_sizes(out_dir, manifest)
+        if browser:
+            with serve(out_dir) as url, sync_playwright() as playwright:
+                chromium = playwright.chromium.launch(executable_path=executable_path)
+                try:
+                    samples = [measure_page(chromium, url) for _ in range(runs)]
+                    version = chromium.version
+                finally:
+                    chromium.close()
+    for sample in samples:
+        sample.update(measure_app())
+    for metric in samples[0]:
+        results[metric] = round(statistics.median(sample[metric] for sample in samples), 1)
+    return results, version
+
+
+def compare(results, baseline, budgets):
+    """Table rows (metric, baseline, current, change, budget, status) and whether any failed."""
+    rows, failed = [], False
+    for metric, current in results.items():
+        base = baseline.get(metric)
+        percent, slack = budgets[metric]
+        budget = f"+{percent:g}% / +{slack:g}"
+        if base is None:
+            rows.append((metric, "-", f"{current:g}", "-", budget, "NO BASELINE"))
+            failed = True
+            continue
+        over = current > max(base * (1 + percent / 100), base + slack)
+        failed |= over
+        change = f"{(current - base) / base * 100:+.1f}%" if base else f"{current - base:+g}"
+        rows.append((metric, f"{base:g}", f"{current:g}", change, budget, "FAIL" if over else "ok"))
+    return rows, failed
+
+
+def print_table(rows):
+    header = ("metric", "baseline", "current", "change", "budget", "")
+    widths = [max(len(str(row[i])) for row in (header, *rows)) for i in range(len(header))]
+    for row in (header, *rows):
+        print("  ".join(str(cell).ljust(width) if i == 0 else str(cell).rjust(width)
+                        for i, (cell, width) in enumerate(zip(row, widths))).rstrip())
+
+
+def parse_budget(spec):
+    metric, _, value = spec.partition("=")
+    if metric not in BUDGETS or not value:
+        raise argparse.ArgumentTypeError(f"expected METRIC=PERCENT[:SLACK] with METRIC one of {', '.join(BUDGETS)}")
+    percent, _, slack = value.partition(":")
+    return metric, (float(percent), float(slack) if slack else BUDGETS[metric][1])
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog="python benchmark.py")
+    parser.add_argument("--runs", type=int, default=5, help="cold loads per metric (median is kept)")
+    parser.add_argument("--budget", type=parse_budget, action="append", default=[],
+                        metavar="METRIC=PERCENT[:SLACK]", help="override a metric's budget")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--chromium", metavar="PATH", help="Chromium or Chrome build to use instead of Playwright's")
+    parser.add_argument("--no-browser", action="store_true",
+                        help="skip the page metrics; measure the sizes and the app only (no Playwright needed)")
+    parser.add_argument("--update-baseline", action="store_true", help="store this run as the baseline")
+    args = parser.parse_args(argv)
+    if sync_playwright is None and not args.no_browser:
+        raise SystemExit("playwright is not installed: pip install -r requirements-bench.txt "
+                         "&& playwright install chromium")
+
+    results, version = run(args.runs, browser=not args.no_browser, executable_path=args.chromium)
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline.exists() else {"metrics": {}}
+    if args.update_baseline:
+        baseline = {"chromium": version or baseline.get("chromium"), "runs": args.runs,
+                    "recorded": date.today().isoformat(), "metrics": dict(baseline["metrics"], **results)}
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+        print(f"wrote {args.baseline}")
+    if not args.baseline.exists():
+        print(f"error: no baseline at {args.baseline}; record one with --update-baseline", file=sys.stderr)
+    if version and baseline.get("chromium") not in (None, version):
+        print(f"note: baseline was recorded with Chromium {baseline['chromium']}, this run used {version}")
+    rows, failed = compare(results, baseline["metrics"], dict(BUDGETS, **dict(args.budget)))
+    print_table(rows)
+    if failed:
+        print("\nbudget exceeded or no baseline to compare with", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,238 @@
+# Pre-rendered chart images.
+#
+# Until Chart.js has loaded and a chart has hydrated, its .chart-container
+# would be empty - and in print or without JavaScript it stays empty. Each
+# chart is therefore also drawn here, as a static SVG from the same labels
+# and series the page gets (report_data.chart_data) and the styling of the
+# chart-config block, and embedded as an <img> placeholder behind the canvas.
+# The page removes it once the live chart is drawn.
+#
+# Rendering is pure Python (no plotting library). Images are cached on disk
+# under build/chart_images/, keyed by a hash of the chart's data, its style
+# and RENDERER_VERSION, so they are drawn once per data version.
+
+import functools
+import hashlib
+import html
+import json
+import math
+import os
+import textwrap
+import threading
+from pathlib import Path
+from urllib.parse import quote
+
+CACHE_DIR = Path(__file__).resolve().parent / "build" / "chart_images"
+# Bump when the drawing code changes, so cached images are redrawn.
+RENDERER_VERSION = 1
+WIDTH, HEIGHT = 600, 350
+FONT = "font-family=\"Inter, sans-serif\" font-size=\"12\" fill=\"#666\""
+
+# Mirrors the chart-config block in templates/scripts.html.
+STYLES = {
+    "marketGrowthChart": {
+        "kind": "line",
+        "alt": "Line chart of AI in retail market revenue in USD millions over time, with forecast bands",
+        "line": {"label": "Market Revenue (USD M)", "color": "rgb(37, 99, 235)", "fill": "rgba(37, 99, 235, 0.1)"},
+        # (lower series, upper series, label, fill), drawn widest first
+        "bands": [(1, 2, "Forecast P95", "rgba(37, 99, 235, 0.12)"),
+                  (3, 4, "Forecast P75", "rgba(37, 99, 235, 0.25)")],
+    },
+    "componentsChart": {
+        "kind": "doughnut",
+        "alt": "Doughnut chart of market share by AI component",
+        "colors": ["rgba(37, 99, 235, 0.7)", "rgba(59, 130, 246, 0.7)"],
+        "borders": ["rgb(37, 99, 235)", "rgb(59, 130, 246)"],
+    },
+    "consumerSentimentChart": {
+        "kind": "bar",
+        "alt": "Bar chart of consumer sentiment on AI, India compared with the global average",
+        "datasets": [("India (%)", "rgba(37, 99, 235, 0.7)", "rgb(37, 99, 235)"),
+                     ("Global Avg (%)", "rgba(147, 197, 253, 0.7)", "rgb(147, 197, 253)")],
+    },
+}
+
+_memory_lock = threading.Lock()
+
+
+def _text(x, y, text, anchor="middle"):
+    return f'<text x="{x:.1f}" y="{y:.1f}" text-anchor="{anchor}" {FONT}>{html.escape(str(text))}</text>'
+
+
+def _nice_ticks(maximum, count=5):
+    """Tick values from 0 to a round number at or above ``maximum``."""
+    if not maximum > 0:
+        return [0, 1]
+    raw = maximum / count
+    magnitude = 10 ** math.floor(math.log10(raw))
+    step = next(f * magnitude for f in (1, 2, 2.5, 5, 10) if f * magnitude >= raw)
+    return [step * i for i in range(math.ceil(maximum / step - 1e-9) + 1)]
+
+
+def _tick_label(value):
+    return f"{value:,.0f}" if value == int(value) else f"{value:,.1f}"
+
+
+def _legend(items, y):
+    """Centered legend of (label, fill, stroke) swatches at height ``y``."""
+    widths = [40 + 6.5 * len(label) for label, _, _ in items]
+    x = (WIDTH - sum(widths)) / 2
+    parts = []
+    for (label, fill, stroke), width in zip(items, widths):
+        parts.append(f'<rect x="{x:.1f}" y="{y - 9:.1f}" width="30" height="10" fill="{fill}" stroke="{stroke}"/>')
+        parts.append(_text(x + 36, y, label, anchor="start"))
+        x += width
+    return parts
+
+
+def _axes(left, top, right, bottom, ticks, labels, positions):
+    parts = []
+    for tick in ticks:
+        y = bottom - (bottom - top) * tick / ticks[-1]
+        parts.append(f'<line x1="{left}" y1="{y:.1f}" x2="{right}" y2="{y:.1f}" stroke="rgba(0,0,0,0.1)"/>')
+        parts.append(_text(left - 8, y + 4, _tick_label(tick), anchor="end"))
+    # Label at most ~12 categories so they don't collide, wrapping long ones
+    # to the width of their slot.
+    every = max(1, math.ceil(len(labels) / 12))
+    chars = max(4, int((right - left) / len(labels) * every / 6.5)) if labels else 0
+    for i in range(0, len(labels), every):
+        for line, text in enumerate(textwrap.wrap(str(labels[i]), chars)[:2]):
+            parts.append(_text(positions[i], bottom + 18 + 14 * line, text))
+    return parts
+
+
+def _finite(value):
+    return value is not None and math.isfinite(value)
+
+
+def _line_chart(chart, style):
+    left, top, right, bottom = 60, 10, WIDTH - 15, HEIGHT - 70
+    labels, series = chart["labels"], chart["series"]
+    values = [v for s in series for v in s if _finite(v)]
+    ticks = _nice_ticks(max(values, default=0))
+    n = len(labels)
+    xs = [left + (right - left) * (i / (n - 1) if n > 1 else 0.5) for i in range(n)]
+
+    def y(value):
+        return bottom - (bottom - top) * value / ticks[-1]
+
+    parts = _axes(left, top, right, bottom, ticks, labels, xs)
+    legend = [(style["line"]["label"], style["line"]["fill"], style["line"]["color"])]
+    for lower, upper, label, fill in style["bands"]:
+        legend.append((label, fill, fill))
+        # One polygon per run of years where both bounds exist.
+        run = []
+        for i in range(n + 1):
+            if i < n and _finite(series[lower][i]) and _finite(series[upper][i]):
+                run.append(i)
+                continue
+            if len(run) > 1:
+                points = [(xs[j], y(series[upper][j])) for j in run] + [(xs[j], y(series[lower][j])) for j in reversed(run)]
+                parts.append(f'<polygon points="{" ".join(f"{px:.1f},{py:.1f}" for px, py in points)}" fill="{fill}"/>')
+            run = []
+    line = [(xs[i], y(v)) for i, v in enumerate(series[0]) if _finite(v)]
+    if line:
+        path = " ".join(f"{px:.1f},{py:.1f}" for px, py in line)
+        parts.append(f'<polygon points="{line[0][0]:.1f},{bottom} {path} {line[-1][0]:.1f},{bottom}" '
+                     f'fill="{style["line"]["fill"]}"/>')
+        parts.append(f'<polyline points="{path}" fill="none" stroke="{style["line"]["color"]}" stroke-width="3"/>')
+    return parts + _legend(legend, HEIGHT - 20)
+
+
+def _doughnut_chart(chart, style):
+    values = chart["series"][0]
+    total = sum(v for v in values if _finite(v)) or 1
+    cx, cy, outer = WIDTH / 2, (HEIGHT - 50) / 2, (HEIGHT - 70) / 2
+    inner = outer / 2  # Chart.js' default 50% cutout
+    parts, angle = [], -math.pi / 2
+    for i, value in enumerate(values):
+        if not _finite(value) or value <= 0:
+            continue
+        sweep = 2 * math.pi * value / total
+        end = angle + min(sweep, 2 * math.pi - 1e-6)
+        large = 1 if sweep > math.pi else 0
+        points = [(cx + r * math.cos(a), cy + r * math.sin(a)) for r, a in
+                  ((outer, angle), (outer, end), (inner, end), (inner, angle))]
+        d = (f"M{points[0][0]:.2f},{points[0][1]:.2f} A{outer},{outer} 0 {large} 1 {points[1][0]:.2f},{points[1][1]:.2f} "
+             f"L{points[2][0]:.2f},{points[2][1]:.2f} A{inner},{inner} 0 {large} 0 {points[3][0]:.2f},{points[3][1]:.2f} Z")
+        fill = style["colors"][i % len(style["colors"])]
+        stroke = style["borders"][i % len(style["borders"])]
+        parts.append(f'<path d="{d}" fill="{fill}" stroke="{stroke}"/>')
+        angle += sweep
+    legend = [(label, style["colors"][i % len(style["colors"])], style["borders"][i % len(style["borders"])])
+              for i, label in enumerate(chart["labels"])]
+    return parts + _legend(legend, HEIGHT - 20)
+
+
+def _bar_chart(chart, style):
+    left, top, right, bottom = 50, 10, WIDTH - 15, HEIGHT - 70
+    labels, series = chart["labels"], chart["series"]
+    ticks = _nice_ticks(max((v for s in series for v in s if _finite(v)), default=0))
+    slot = (right - left) / max(len(labels), 1)
+    centers = [left + slot * (i + 0.5) for i in range(len(labels))]
+    parts = _axes(left, top, right, bottom, ticks, labels, centers)
+    # Chart.js defaults: 80% of each category, 90% of that per bar.
+    bar = slot * 0.8 / len(series)
+    for d, values in enumerate(series):
+        _, fill, stroke = style["datasets"][d]
+        for i, value in enumerate(values):
+            if not _finite(value):
+                continue
+            height = (bottom - top) * value / ticks[-1]
+            x = centers[i] - slot * 0.4 + bar * d + bar * 0.05
+            parts.append(f'<rect x="{x:.1f}" y="{bottom - height:.1f}" width="{bar * 0.9:.1f}" '
+                         f'height="{height:.1f}" fill="{fill}" stroke="{stroke}"/>')
+    return parts + _legend(style["datasets"], HEIGHT - 20)
+
+
+_RENDERERS = {"line": _line_chart, "doughnut": _doughnut_chart, "bar": _bar_chart}
+
+
+def render_svg(chart_id, chart):
+    """SVG markup of one chart, from its labels and plain-list series."""
+    style = STYLES[chart_id]
+    body = "\n".join(_RENDERERS[style["kind"]](chart, style))
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {WIDTH} {HEIGHT}" '
+            f'width="{WIDTH}" height="{HEIGHT}">\n{body}\n</svg>\n')
+
+
+def image_key(chart_id, chart):
+    payload = json.dumps([RENDERER_VERSION, chart_id, chart, STYLES[chart_id]], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_svg(chart_id, key, chart_json):
+    path = CACHE_DIR / f"{chart_id}.{key}.svg"
+    if path.exists():
+        return path.read_text(encoding="utf-8")
+    svg = render_svg(chart_id, json.loads(chart_json))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(svg, encoding="utf-8")
+    os.replace(tmp, path)
+    return svg
+
+
+def chart_svg(chart_id, chart):
+    """render_svg() through the memory and disk caches."""
+    chart = {"labels": chart["labels"], "series": [[None if v is None or v != v else v for v in s]
+                                                   for s in chart["series"]]}
+    with _memory_lock:
+        return _cached_svg(chart_id, image_key(chart_id, chart), json.dumps(chart))
+
+
+def placeholder(chart_id, chart):
+    """<img> that stands in for the chart until its canvas is drawn."""
+    src = "data:image/svg+xml," + quote(chart_svg(chart_id, chart), safe=" =:/,.()'")
+    alt = html.escape(STYLES[chart_id]["alt"])
+    return f'<img class="chart-placeholder" src="{src}" alt="{alt}" width="{WIDTH}" height="{HEIGHT}">'
+
+
+if __name__ == "__main__":
+    import report_data
+
+    charts = report_data.chart_data(report_data.load_report_data(), encoding=None)
+    for chart_id, chart in charts.items():
+        svg = chart_svg(chart_id, chart)
+        print(f"{len(svg):>7,} bytes  {CACHE_DIR / f'{chart_id}.{image_key(chart_id, chart)}.svg'}")
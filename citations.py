@@ -0,0 +1,125 @@
+# Citation registry, compiled into the report at render time.
+#
+# Sources are listed once, by key, in data/<version>/references.csv
+# (key, title, publisher, date; a segment or state folder may override it like
+# any other table). Section partials cite them by key:
+#
+#     <span data-stat="cagr">{{ cagr }}</span>{{ cite: grandview-2024 techsci-2024 }}
+#
+# compile_sections() numbers the references in order of first citation across
+# the sections (references nobody cites follow, in registry order), replaces
+# every marker with its superscript links and builds the reference list for
+# {{ reference_list }} in templates/references.html. It fails with a
+# CitationError on an unknown key, a duplicate key in the registry or a stat
+# figure (<span data-stat>) without a citation in the same paragraph, and
+# check_anchors() fails on any in-page link of the assembled document whose
+# target doesn't exist.
+#
+# Each section is compiled on its own and cached by its template text and the
+# numbers of the references it cites, so editing one partial recompiles only
+# that partial - and any later one whose numbers shift.
+#
+# `python citations.py` validates the templates and prints the numbering.
+
+import functools
+import html
+import re
+from dataclasses import dataclass
+
+import pandas as pd
+
+import report_data
+
+CITE = re.compile(r"\{\{\s*cite:\s*([\w\s-]*?)\s*\}\}")
+_STAT = re.compile(r'<span data-stat="(\w+)">.*?</span>')
+_BLOCK_END = re.compile(r"</(?:p|li|td|div)>")
+
+
+class CitationError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class CompiledCitations:
+    sections: dict  # section name -> template with the markers replaced
+    reference_list: str  # <li> items for {{ reference_list }}
+    numbers: dict  # key -> reference number
+    uncited: tuple  # keys listed but never cited
+
+
+def load_registry(version=report_data.DATA_VERSION, segment="", state=""):
+    """(key, reference text) for every listed source, in registry order."""
+    registry = []
+    for row in report_data.load_table("references", version, segment, state).itertuples(index=False):
+        if any(key == row.key for key, _ in registry):
+            raise CitationError(f"reference {row.key!r} is listed twice")
+        text = f'"{row.title}" {row.publisher}'
+        if not pd.isna(row.date) and str(row.date).strip():
+            text += f", {row.date}"
+        registry.append((row.key, html.escape(text + ".", quote=False)))
+    return tuple(registry)
+
+
+@functools.lru_cache(maxsize=64)
+def cited_keys(template):
+    """Keys cited by ``template``, in order of appearance, with repeats."""
+    return tuple(key for match in CITE.finditer(template) for key in match.group(1).split())
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_section(name, template, numbers):
+    numbers = dict(numbers)
+    for stat in _STAT.finditer(template):
+        cite, end = CITE.search(template, stat.end()), _BLOCK_END.search(template, stat.end())
+        if cite is None or end is not None and end.start() < cite.start():
+            raise CitationError(f"{name}.html: figure {stat.group(1)!r} has no citation in its paragraph")
+
+    def links(match):
+        refs = sorted({numbers[key] for key in match.group(1).split()})
+        if not refs:
+            raise CitationError(f"{name}.html: empty citation {match.group(0)!r}")
+        return ('<sup class="reference-link-sup">'
+                + "".join(f'<a href="#ref-{n}">[{n}]</a>' for n in refs) + "</sup>")
+
+    return CITE.sub(links, template)
+
+
+@functools.lru_cache(maxsize=8)
+def _reference_list(entries):
+    return "\n            ".join(f'<li id="ref-{n}">{text}</li>' for n, text in entries)
+
+
+def compile_sections(templates, registry):
+    """Resolve and number the citations of ``templates`` ({name: template}, in page order)."""
+    texts = dict(registry)
+    order = {}
+    for name, template in templates.items():
+        for key in cited_keys(template):
+            if key not in texts:
+                raise CitationError(f"{name}.html cites unknown reference {key!r}")
+            order.setdefault(key, len(order) + 1)
+    uncited = tuple(key for key, _ in registry if key not in order)
+    numbers = dict(order, **{key: len(order) + i for i, key in enumerate(uncited, 1)})
+    sections = {name: _compile_section(name, template,
+                                       tuple((key, numbers[key]) for key in dict.fromkeys(cited_keys(template))))
+                for name, template in templates.items()}
+    entries = tuple(sorted((n, texts[key]) for key, n in numbers.items()))
+    return CompiledCitations(sections, _reference_list(entries), numbers, uncited)
+
+
+def check_anchors(document):
+    """Raise CitationError if an in-page link of ``document`` has no target."""
+    ids = set(re.findall(r'\sid="([^"]+)"', document))
+    missing = sorted(set(re.findall(r'\shref="#([^"]+)"', document)) - ids)
+    if missing:
+        raise CitationError(f"links to missing targets: {', '.join('#' + target for target in missing)}")
+
+
+if __name__ == "__main__":
+    import report
+
+    compiled = compile_sections({name: report.load_template(name) for name in report.SECTIONS}, load_registry())
+    report.build_html(head="")  # runs check_anchors on the assembled page
+    for key, number in sorted(compiled.numbers.items(), key=lambda item: item[1]):
+        print(f"[{number:>2}] {key}{'  (not cited)' if key in compiled.uncited else ''}")
+    print(f"sections compiled: {_compile_section.cache_info().misses}")
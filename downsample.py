@@ -0,0 +1,85 @@
+# Downsampling for time series charts.
+#
+# A line chart can't show more points than its container has pixels, so long
+# series are reduced to that budget on the Python side before they are
+# embedded. Payload size and draw time then stay constant however long the
+# series gets, and zooming re-queries the visible window at the same budget.
+
+import numpy as np
+
+# .chart-container is at most 600 CSS pixels wide; one point per pixel is as
+# much detail as the canvas can show.
+CHART_PIXEL_BUDGET = 600
+
+
+def lttb(x, y, n_out):
+    """Largest-Triangle-Three-Buckets: indices of ``n_out`` representative points.
+
+    Keeps the first and last point and, from each bucket in between, the point
+    forming the largest triangle with the previously kept point and the mean
+    of the next bucket. The walk over buckets is inherently sequential; the
+    work inside each bucket is vectorized.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    # Mean of every bucket up front, plus the last point as the final "bucket".
+    sums_x = np.add.reduceat(x[1:n - 1], edges[:-1] - 1)
+    sums_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1)
+    counts = np.diff(edges)
+    means_x = np.append(sums_x / counts, x[-1])
+    means_y = np.append(sums_y / counts, y[-1])
+
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    a = 0
+    for bucket in range(n_out - 2):
+        lo, hi = edges[bucket], edges[bucket + 1]
+        next_x, next_y = means_x[bucket + 1], means_y[bucket + 1]
+        area = np.abs((x[a] - next_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (next_y - y[a]))
+        a = lo + int(area.argmax())
+        indices[bucket + 1] = a
+    return indices
+
+
+def minmax(x, y, n_out):
+    """Min/max bucketing: the lowest and highest point of each bucket.
+
+    Fully vectorized and preserves every spike, at the cost of showing two
+    points per bucket. Returns at most ``n_out`` sorted indices.
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n_out >= n or n_out < 4:
+        return np.arange(n)
+    # Two of the n_out points are the endpoints, which are always kept.
+    n_buckets = (n_out - 2) // 2
+    bucket = np.arange(n) * n_buckets // n
+    order = np.lexsort((y, bucket))  # by bucket, then by value
+    starts = np.searchsorted(bucket[order], np.arange(n_buckets))
+    ends = np.append(starts[1:], n) - 1
+    return np.unique(np.concatenate([order[starts], order[ends], [0, n - 1]]))
+
+
+METHODS = {"lttb": lttb, "minmax": minmax}
+
+
+def downsample(x, y, n_out=CHART_PIXEL_BUDGET, method="lttb", start=0, end=None):
+    """Indices (into the full series) of the points to draw for ``[start, end]``.
+
+    ``start``/``end`` are inclusive positions in the full series; a zoomed view
+    passes the window it shows and gets the same point budget for it. A
+    window narrower than two points is widened to two, never to the whole
+    series.
+    """
+    n = len(y)
+    if n < 2:
+        return np.arange(n)
+    start = min(max(int(start), 0), n - 2)
+    end = n - 1 if end is None else min(int(end), n - 1)
+    end = max(end, start + 1)
+    window = slice(start, end + 1)
+    return start + METHODS[method](np.asarray(x)[window], np.asarray(y)[window], n_out)
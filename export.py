@@ -0,0 +1,142 @@
+# Static export of the report: `python Website.py export dist/`
+#
+# Writes index.html plus the asset bundle from assets.py (and, for the
+# streamed delivery, the later sections) with content-hashed filenames, and
+# gzip/brotli variants of every text file, so the report can be served by any
+# static server or CDN without a Streamlit process. Hashed files never change,
+# so they can be cached forever ("Cache-Control: public, max-age=31536000,
+# immutable"); only index.html needs revalidation.
+#
+# Nothing here imports streamlit.
+
+import argparse
+import gzip
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+import assets
+import report_data
+from report import DELIVERY, DELIVERIES, ReportParams, build_html, build_sections
+
+try:
+    import brotli
+except ImportError:  # optional: `pip install brotli` to also emit .br files
+    brotli = None
+
+COMPRESSIBLE = (".html", ".css", ".js", ".json")
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()[:12]
+
+
+def hashed_name(stem, data, suffix):
+    return f"{stem}.{content_hash(data)}{suffix}"
+
+
+def write_file(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    written = [path]
+    if path.suffix in COMPRESSIBLE:
+        # mtime=0 keeps the .gz byte-identical across exports of the same content.
+        gz = path.with_name(path.name + ".gz")
+        gz.write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+        written.append(gz)
+        if brotli is not None:
+            br = path.with_name(path.name + ".br")
+            br.write_bytes(brotli.compress(data, quality=11))
+            written.append(br)
+    return written
+
+
+def export_site(out_dir, hashed_index=False, component_version=None, params=None):
+    """Export the report into ``out_dir``; returns ``(manifest, written)``.
+
+    ``manifest`` maps logical names to the hashed paths. With ``hashed_index``
+    the document itself is also written under a content-hashed name, which is
+    how Website.py publishes it to Streamlit's static folder.
+    ``component_version`` builds the document as a Streamlit component
+    (see templates/component_bridge.html). ``params`` selects the report
+    variant (see report.ReportParams).
+    """
+    assets.require_vendored()
+    out_dir = Path(out_dir)
+    manifest = {}
+    written = []
+
+    def emit(logical, stem, data, suffix):
+        name = "assets/" + hashed_name(stem, data, suffix)
+        # A hashed file that already exists has exactly this content.
+        if not (out_dir / name).exists():
+            written.extend(write_file(out_dir / name, data))
+        manifest[logical] = name
+        return name
+
+    css = assets.TAILWIND_CSS.read_text(encoding="utf-8")
+    fonts = ""
+    for weight, path in assets.INTER_FONTS.items():
+        if path.exists():
+            font = emit(path.name, path.stem, path.read_bytes(), ".woff2")
+            # The stylesheet lives in assets/ next to the fonts, so link them relatively.
+            fonts += assets.font_face(weight, Path(font).name)
+    css = fonts + css
+    stylesheet = emit("report.css", "report", css.encode("utf-8"), ".css")
+    tags = [f'<link rel="stylesheet" href="{stylesheet}">']
+
+    if assets.CHART_JS.exists():
+        chart_js = emit("chart.umd.js", "chart.umd", assets.CHART_JS.read_bytes(), ".js")
+        # Deferred: the page only touches Chart.js after DOMContentLoaded, which
+        # waits for deferred scripts, so parsing the body is never blocked.
+        tags.append(f'<script id="chart-js" src="{chart_js}" defer></script>')
+    else:
+        print("warning: Chart.js is not vendored; REPORT_ALLOW_CDN=1 is set, "
+              "so the export loads it from the CDN", file=sys.stderr)
+        tags.append(f'<script id="chart-js" src="{assets.CHART_JS_URL}" defer></script>')
+
+    html = build_html(params, head="\n    ".join(tags), component_version=component_version).encode("utf-8")
+    if hashed_index:
+        index = hashed_name("report", html, ".html")
+        if not (out_dir / index).exists():
+            written.extend(write_file(out_dir / index, html))
+    else:
+        index = "index.html"
+        written.extend(write_file(out_dir / index, html))
+    manifest["index.html"] = index
+    # Streamed delivery: the sections the page fetches after the first screen.
+    for section, (path, chunk) in build_sections(params).items():
+        if not (out_dir / path).exists():
+            written.extend(write_file(out_dir / path, chunk.encode("utf-8")))
+        manifest[f"section-{section}.html"] = path
+    written.extend(write_file(out_dir / "manifest.json",
+                              json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8")))
+    return manifest, written
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog="python Website.py export")
+    parser.add_argument("out_dir", nargs="?", default="dist")
+    parser.add_argument("--segment", default="", help="retail segment, e.g. grocery")
+    parser.add_argument("--state", default="", help="Indian state, e.g. Maharashtra")
+    parser.add_argument("--delivery", choices=DELIVERIES, default=DELIVERY,
+                        help="streamed: send the first screen first, the other sections as separate files")
+    args = parser.parse_args(argv)
+    params = ReportParams(segment=args.segment.lower(), state=args.state, delivery=args.delivery)
+    try:
+        report_data.check_variant(params.data_version, params.segment, params.state)
+    except ValueError as error:
+        parser.error(str(error))
+    try:
+        _, written = export_site(args.out_dir, params=params)
+    except assets.AssetError as error:
+        raise SystemExit(f"error: {error}")
+    for path in written:
+        print(f"{path.stat().st_size:>9,}  {path}")
+    if brotli is None:
+        print("brotli is not installed, skipped .br variants", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,71 @@
+# Monte Carlo forecast for the market growth projection.
+#
+# Instead of one fixed projection, simulate many growth paths at once: every
+# path compounds a yearly log-normal growth factor whose median is the assumed
+# CAGR and whose spread is the assumed volatility. The whole batch is a single
+# (paths x years) NumPy computation, and the percentiles across paths give the
+# bands the chart shades. Results are memoized per scenario with LRU eviction,
+# so moving a what-if slider back to a value seen before costs a cache lookup.
+
+import functools
+from dataclasses import dataclass
+
+import numpy as np
+
+PERCENTILES = (5, 25, 50, 75, 95)
+DEFAULT_VOLATILITY = 0.10
+DEFAULT_PATHS = 10_000
+
+
+@dataclass(frozen=True)
+class Scenario:
+    base_year: int
+    base: float
+    horizon: int
+    cagr: float
+    volatility: float = DEFAULT_VOLATILITY
+    paths: int = DEFAULT_PATHS
+    seed: int = 0
+
+
+@dataclass(frozen=True)
+class Forecast:
+    scenario: Scenario
+    years: np.ndarray
+    # percentile -> values for each year in `years`, starting at the base year
+    bands: dict
+
+
+@functools.lru_cache(maxsize=256)
+def simulate(scenario):
+    """Percentile bands of ``scenario.paths`` simulated growth paths.
+
+    The returned arrays are shared by every caller of the same scenario and
+    are read-only.
+    """
+    rng = np.random.default_rng(scenario.seed)
+    # Median yearly growth factor is 1 + cagr, so the median path is the
+    # deterministic projection.
+    log_growth = rng.normal(np.log1p(scenario.cagr), scenario.volatility,
+                            size=(scenario.paths, scenario.horizon))
+    paths = scenario.base * np.exp(np.cumsum(log_growth, axis=1))
+    paths = np.hstack([np.full((scenario.paths, 1), scenario.base), paths])
+    values = np.percentile(paths, PERCENTILES, axis=0)
+    values.setflags(write=False)
+    years = np.arange(scenario.base_year, scenario.base_year + scenario.horizon + 1)
+    years.setflags(write=False)
+    return Forecast(scenario, years, dict(zip(PERCENTILES, values)))
+
+
+def align(forecast, years, percentile):
+    """Values of one band at ``years``; NaN outside the forecast's years.
+
+    ``years`` may be fractional (a date within its year): those values are
+    interpolated geometrically between the simulated years, and the last
+    simulated year's values hold until the end of that year.
+    """
+    years = np.asarray(years, dtype=float)
+    out = np.full(len(years), np.nan)
+    inside = (years >= forecast.years[0]) & (years < forecast.years[-1] + 1)
+    out[inside] = np.exp(np.interp(years[inside], forecast.years, np.log(forecast.bands[percentile])))
+    return out
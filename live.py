@@ -0,0 +1,46 @@
+# Live refresh of the embedded report.
+#
+# With REPORT_LIVE_SECONDS set, Website.py re-runs the report component in a
+# fragment on that interval. Each run compares the current data with the
+# snapshot the page was rendered from and sends only what differs - stat card
+# texts and individual chart series - as a component argument. The page
+# applies them in place (textContent for the cards, Chart.js update() for the
+# series), so the iframe is never reloaded and scroll position, open tabs and
+# accordion items, and the charts themselves survive every refresh.
+
+import functools
+
+import report_data
+
+
+@functools.lru_cache(maxsize=64)
+def _snapshot(params, fingerprint):
+    data = report_data.load_report_data(params.data_version, params.segment, params.state)
+    return {"stats": report_data.page_values(data), "charts": report_data.chart_data(data, params.chart_encoding)}
+
+
+def snapshot(params):
+    """Stat card texts and encoded chart series of the current data for ``params``."""
+    return _snapshot(params, report_data.data_fingerprint(params.data_version, params.segment, params.state))
+
+
+def delta(base, current, skip=()):
+    """What changed from ``base`` to ``current``, or None if nothing did.
+
+    Stats are sent by key, chart series by position; a chart's labels (and
+    point index) travel with any of its changed series. Charts in ``skip``
+    are left out.
+    """
+    stats = {key: value for key, value in current["stats"].items() if base["stats"].get(key) != value}
+    charts = {}
+    for chart_id, chart in current["charts"].items():
+        if chart_id in skip:
+            continue
+        old = base["charts"].get(chart_id, {"labels": None, "series": []})
+        series = {i: values for i, values in enumerate(chart["series"])
+                  if i >= len(old["series"]) or old["series"][i] != values}
+        if series or chart["labels"] != old["labels"]:
+            charts[chart_id] = dict(chart, series=series)
+    if not stats and not charts:
+        return None
+    return {"stats": stats, "charts": charts}
@@ -0,0 +1,257 @@
+# Rendering of the report from the page partials in templates/.
+#
+# templates/layout.html holds the <head>, header and footer with slots for the
+# section partials (hero, market, consumer, applications, leaders, references)
+# and the page script. build_html() fills them for one set of ReportParams -
+# segment, state, data version - from report_data.py, and keeps the assembled
+# document in a bounded LRU cache so one process can serve a few hundred
+# variants without re-rendering on every rerun. Citations in the partials are
+# resolved and checked against the reference registry first (citations.py).
+# Below that, the data values, each section and its part of the search index
+# are cached on their own inputs (render_sections), so a template edit only
+# re-renders the sections it touches.
+#
+# With the "streamed" delivery the document only carries FIRST_SECTIONS; every
+# later section is left as a placeholder and published as its own
+# content-hashed file (build_sections), which the page fetches and attaches
+# in order once the first screen is up.
+#
+# This module never imports streamlit, so build tooling (assets.py, the static
+# export) can use it directly.
+
+import functools
+import hashlib
+import html
+import os
+import re
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+import assets
+import chart_images
+import citations
+import report_data
+import search_index
+import transport
+
+TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
+SECTIONS = ("hero", "market", "consumer", "applications", "leaders", "references")
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+# "main" draws the charts on the page's main thread; "worker" hands each canvas
+# to a Web Worker running Chart.js on an OffscreenCanvas (see scripts.html),
+# falling back to "main" in browsers without OffscreenCanvas.
+CHART_RENDERERS = ("main", "worker")
+CHART_RENDERER = os.environ.get("REPORT_CHART_RENDERER", "main")
+# "document" sends the whole report at once; "streamed" sends FIRST_SECTIONS
+# with the page and the rest as separate section files (see the comment above).
+DELIVERIES = ("document", "streamed")
+DELIVERY = os.environ.get("REPORT_DELIVERY", "document")
+FIRST_SECTIONS = ("hero", "market")
+
+
+@dataclass(frozen=True)
+class ReportParams:
+    segment: str = ""  # e.g. "grocery", "fashion", "electronics"
+    state: str = ""  # e.g. "Maharashtra"
+    data_version: str = report_data.DATA_VERSION
+    chart_encoding: str = transport.CHART_ENCODING
+    chart_renderer: str = CHART_RENDERER
+    delivery: str = DELIVERY
+
+    @property
+    def name(self):
+        name = f"AI in Indian {self.segment.title()} Retail" if self.segment else "AI in Indian Retail"
+        return f"{name} ({self.state})" if self.state else name
+
+    @property
+    def slug(self):
+        slug = "-".join(part for part in (self.segment, self.state) if part) or "all"
+        return re.sub(r"[^a-z0-9]+", "-", slug.lower()).strip("-")
+
+
+def _size(entry):
+    # A document, or the rendered values of a variant's sections.
+    if isinstance(entry, dict):
+        return sum(sys.getsizeof(value) for value in entry.values())
+    return sys.getsizeof(entry)
+
+
+class DocumentCache:
+    """LRU cache of assembled documents, bounded by their total size in memory."""
+
+    def __init__(self, max_bytes=CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = self.misses = self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_render(self, key, render):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+        # Rendered outside the lock; two sessions missing the same key at once
+        # just render it twice.
+        document = render()
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = document
+                self.bytes += _size(document)
+                while self.bytes > self.max_bytes and len(self._entries) > 1:
+                    _, evicted = self._entries.popitem(last=False)
+                    self.bytes -= _size(evicted)
+                    self.evictions += 1
+        return document
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self.bytes, "hits": self.hits,
+                    "misses": self.misses, "evictions": self.evictions}
+
+
+document_cache = DocumentCache()
+
+
+@functools.lru_cache(maxsize=32)
+def _read_template(path, mtime_ns):
+    return path.read_text(encoding="utf-8")
+
+
+def load_template(name):
+    path = TEMPLATE_DIR / f"{name}.html"
+    return _read_template(path, path.stat().st_mtime_ns)
+
+
+_PLACEHOLDER = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+
+def render_template(template, values):
+    # {{ name }} placeholders; a missing value is an error, not an empty string.
+    # A single pass, so placeholders inside substituted values stay literal.
+    return _PLACEHOLDER.sub(lambda match: values[match.group(1)], template)
+
+
+@functools.lru_cache(maxsize=256)
+def _render_section(template, values):
+    return render_template(template, dict(values))
+
+
+def render_section(template, values):
+    """render_template() memoized on the template and only the values it uses."""
+    used = tuple((name, values[name]) for name in dict.fromkeys(_PLACEHOLDER.findall(template)))
+    return _render_section(template, used)
+
+
+def page_values(params, data):
+    """Values for the placeholders: text is HTML-escaped, chart data is JSON."""
+    text = dict(report_data.page_values(data), report_name=params.name)
+    values = {key: html.escape(value) for key, value in text.items()}
+    values["chart_data"] = report_data.chart_data_json(data, params.chart_encoding)
+    if params.chart_renderer not in CHART_RENDERERS:
+        raise ValueError(f"unknown chart renderer {params.chart_renderer!r}, expected one of {CHART_RENDERERS}")
+    values["chart_renderer"] = params.chart_renderer
+    for chart_id, chart in report_data.chart_data(data, encoding=None).items():
+        values[f"{chart_id}_image"] = chart_images.placeholder(chart_id, chart)
+    return values
+
+
+def render_sections(params):
+    """Values for the layout with every section rendered, and the search index.
+
+    Every step is cached on its own inputs: the data values on the data
+    (cached_values), each compiled partial on its template and reference
+    numbers (citations.py), each rendered section on its compiled text and the
+    values it uses, and the search index per section. Editing one partial
+    therefore re-renders and re-indexes only that section.
+    """
+    values = dict(cached_values(params))
+    registry = citations.load_registry(params.data_version, params.segment, params.state)
+    compiled = citations.compile_sections({partial: load_template(partial) for partial in SECTIONS}, registry)
+    values["reference_list"] = compiled.reference_list
+    for partial in SECTIONS:
+        values[partial] = render_section(compiled.sections[partial], values)
+    values["search_index"] = search_index.index_json(tuple(values[partial] for partial in SECTIONS))
+    return values
+
+
+def section_files(values):
+    """{section: (path, html)} of the sections a streamed page fetches later."""
+    files = {}
+    for partial in SECTIONS:
+        if partial not in FIRST_SECTIONS:
+            digest = hashlib.sha256(values[partial].encode("utf-8")).hexdigest()[:12]
+            files[partial] = (f"assets/section-{partial}.{digest}.html", values[partial])
+    return files
+
+
+def render_report(params, head, component_version=None):
+    if params.delivery not in DELIVERIES:
+        raise ValueError(f"unknown delivery {params.delivery!r}, expected one of {DELIVERIES}")
+    if params.delivery == "streamed":
+        values = dict(cached_sections(params))
+        files = section_files(values)
+        for partial, (path, _) in files.items():
+            values[partial] = render_template(load_template("pending_section"), {"section": partial, "src": path})
+    else:
+        values, files = render_sections(params), {}
+    values["scripts"] = render_template(load_template("scripts"), values)
+    values["assets"] = head
+    values["component_bridge"] = ""
+    if component_version is not None:
+        # See templates/component_bridge.html and Website.py.
+        values["component_bridge"] = render_template(load_template("component_bridge"),
+                                                     {"version": component_version})
+    document = render_template(load_template("layout"), values)
+    # Links may point into sections that arrive later.
+    citations.check_anchors(document + "".join(section for _, section in files.values()))
+    return document
+
+
+def fingerprint(params):
+    """Changes whenever a template, data table or the inline asset bundle does."""
+    templates = tuple(path.stat().st_mtime_ns for path in sorted(TEMPLATE_DIR.glob("*.html")))
+    data = report_data.data_fingerprint(params.data_version, params.segment, params.state)
+    return templates, data, assets.bundle_stamp()
+
+
+def cached_values(params):
+    # Chart data and images depend on the data only, not on the templates.
+    key = ("values", params, report_data.data_fingerprint(params.data_version, params.segment, params.state))
+    return document_cache.get_or_render(key, lambda: page_values(
+        params, report_data.load_report_data(params.data_version, params.segment, params.state)))
+
+
+def cached_sections(params):
+    # Shared by the document and the section files of one variant, so a
+    # streamed export renders the sections once.
+    return document_cache.get_or_render(("sections", params, fingerprint(params)), lambda: render_sections(params))
+
+
+def build_html(params=None, head=None, component_version=None):
+    """The assembled report for ``params``, from the document cache.
+
+    ``head`` lets the static export link hashed asset files instead of
+    inlining the bundle; ``component_version`` adds the component bridge.
+    """
+    params = params or ReportParams()
+    key = (params, head, component_version, fingerprint(params))
+    return document_cache.get_or_render(
+        key, lambda: render_report(params, assets.head_tags() if head is None else head, component_version))
+
+
+def build_sections(params=None):
+    """{section: (path, html)} to publish next to a streamed document.
+
+    Paths are relative to the document and content-hashed; empty for the
+    "document" delivery.
+    """
+    params = params or ReportParams()
+    if params.delivery != "streamed":
+        return {}
+    return section_files(cached_sections(params))
@@ -0,0 +1,311 @@
+# Dataset layer for every figure in the report.
+#
+# The numbers used to be literals inside the HTML string. They now live in
+# versioned tables under data/<version>/ (CSV or Parquet, same stem):
+#
+#     market_growth       year or period, revenue_usd_m, actual
+#     components          component, share_pct
+#     consumer_sentiment  statement, india_pct, global_pct
+#     stats               key, value, format
+#     references          key, title, publisher, date (see citations.py)
+#
+# market_growth is yearly by default. A finer series (monthly, say) has a
+# ``period`` column of dates instead; revenue_usd_m is then the annual run rate
+# at each date, the chart is labelled by period and the CAGR and forecast use
+# the mean of each calendar year (see yearly). ``actual`` is 1 for reported
+# rows and 0 for projections; the forecast starts from the year of the last
+# reported row.
+#
+# If data/<version>/survey/ holds raw survey exports, the consumer sentiment
+# table is computed from them instead (see survey.py).
+#
+# Report variants look for each table under data/<version>/segments/<segment>/
+# and data/<version>/states/<state>/ first (see data_dirs), and fall back to
+# the national table.
+#
+# Tables are cached by file content hash, like st.cache_data would, but
+# without importing streamlit so the static export can use them too. Figures
+# that restate a series (the "open to AI" card) are computed from it so they
+# cannot drift from the data; figures quoted from a source, like the headline
+# CAGR, are stats rows so the page shows what the cited source published.
+
+import functools
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import downsample
+import forecast
+import survey
+import transport
+
+DATA_DIR = Path(__file__).resolve().parent / "data"
+DATA_VERSION = os.environ.get("REPORT_DATA_VERSION", "v1")
+
+# Period of the headline "Projected CAGR" card (the figure itself is the
+# sourced stats row "cagr").
+CAGR_PERIOD = (2025, 2030)
+
+@dataclass(frozen=True)
+class ReportData:
+    version: str
+    market_growth: pd.DataFrame
+    components: pd.DataFrame
+    consumer_sentiment: pd.DataFrame
+    stats: pd.DataFrame
+
+
+TABLES = ("market_growth", "components", "consumer_sentiment", "stats", "references")
+
+
+def _folders(path):
+    return sorted(child.name for child in path.iterdir() if child.is_dir()) if path.is_dir() else []
+
+
+def check_variant(version=DATA_VERSION, segment="", state=""):
+    """Raise ValueError unless the segment and state have a data folder.
+
+    Names are matched against the folders that exist, never joined into a
+    path first, so a value from a URL can't point anywhere else.
+    """
+    base = DATA_DIR / version
+    segments = _folders(base / "segments")
+    if segment and segment not in segments:
+        raise ValueError(f"no data for segment {segment!r}; available: {', '.join(segments) or 'none'}")
+    states = set(_folders(base / "states"))
+    if segment:
+        states.update(_folders(base / "segments" / segment / "states"))
+    if state and state not in states:
+        raise ValueError(f"no data for state {state!r}; available: {', '.join(sorted(states)) or 'none'}")
+
+
+def data_dirs(version=DATA_VERSION, segment="", state=""):
+    """Folders searched for a report variant's tables, most specific first.
+
+    A segment or state only needs the tables that differ from the national
+    ones, e.g. data/v1/segments/grocery/market_growth.csv. Unknown variants
+    raise ValueError (see check_variant).
+    """
+    check_variant(version, segment, state)
+    base = DATA_DIR / version
+    dirs = []
+    if segment and state:
+        dirs.append(base / "segments" / segment / "states" / state)
+    if segment:
+        dirs.append(base / "segments" / segment)
+    if state:
+        dirs.append(base / "states" / state)
+    dirs.append(base)
+    return dirs
+
+
+def table_path(name, version=DATA_VERSION, segment="", state=""):
+    for folder in data_dirs(version, segment, state):
+        for suffix in (".parquet", ".csv"):
+            path = folder / (name + suffix)
+            if path.exists():
+                return path
+    raise FileNotFoundError(f"no {name}.parquet or {name}.csv in {DATA_DIR / version}")
+
+
+def survey_dir(version=DATA_VERSION, segment="", state=""):
+    for folder in data_dirs(version, segment, state):
+        if (folder / "survey").is_dir():
+            return folder / "survey"
+    return None
+
+
+@functools.lru_cache(maxsize=64)
+def _digest(path, mtime_ns, size):
+    # Hashing is only repeated when the file's stat changes.
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def file_digest(path):
+    stat = Path(path).stat()
+    return _digest(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=128)
+def _read_table(path, digest):
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+def load_table(name, version=DATA_VERSION, segment="", state=""):
+    """Load one table, served from cache while the file's content is unchanged.
+
+    The returned frame is shared between callers; don't modify it in place.
+    """
+    path = table_path(name, version, segment, state)
+    return _read_table(str(path), file_digest(path))
+
+
+def load_consumer_sentiment(version=DATA_VERSION, segment="", state=""):
+    folder = survey_dir(version, segment, state)
+    if folder is not None:
+        return survey.consumer_sentiment(folder)
+    return load_table("consumer_sentiment", version, segment, state)
+
+
+def load_report_data(version=DATA_VERSION, segment="", state=""):
+    return ReportData(
+        version=version,
+        market_growth=load_table("market_growth", version, segment, state),
+        components=load_table("components", version, segment, state),
+        consumer_sentiment=load_consumer_sentiment(version, segment, state),
+        stats=load_table("stats", version, segment, state).set_index("key"),
+    )
+
+
+def data_fingerprint(version=DATA_VERSION, segment="", state=""):
+    """Content digests of every input a report variant is built from."""
+    digests = []
+    for name in TABLES:
+        try:
+            digests.append(file_digest(table_path(name, version, segment, state)))
+        except FileNotFoundError:
+            digests.append(None)  # consumer_sentiment may come from a survey
+    folder = survey_dir(version, segment, state)
+    if folder is not None:
+        digests.extend((path.name, path.stat().st_size, path.stat().st_mtime_ns)
+                       for path in survey.survey_files(folder))
+    return tuple(digests)
+
+
+def growth_rates(values):
+    """Year-over-year growth rates of a series."""
+    values = np.asarray(values, dtype=float)
+    return values[1:] / values[:-1] - 1
+
+
+def cagr(years, values, start, end):
+    """Compound annual growth rate of ``values`` between two years."""
+    years = np.asarray(years)
+    values = np.asarray(values, dtype=float)
+    first, last = values[years == start], values[years == end]
+    if not len(first) or not len(last):
+        raise ValueError(f"series has no value for {start} or {end}")
+    return float((last[0] / first[0]) ** (1 / (end - start)) - 1)
+
+
+def _pct(value):
+    return f"{value:g}%"
+
+
+def page_values(data):
+    """Display strings for the {{ placeholders }} in the report template."""
+    sentiment = data.consumer_sentiment.set_index("statement")
+    start, end = CAGR_PERIOD
+    values = {
+        "cagr_start": str(start),
+        "cagr_end": str(end),
+        "consumers_open_to_ai": _pct(sentiment.loc["Open to AI for Purchase Decisions", "india_pct"]),
+        "consumers_open_to_chatbots": _pct(sentiment.loc["Open to Chatbots", "india_pct"]),
+    }
+    for key, row in data.stats.iterrows():
+        values[key] = row["format"].format(row["value"])
+    return values
+
+
+def _dates(market):
+    if "period" in market:
+        return pd.to_datetime(market["period"])
+    return pd.to_datetime(market["year"].astype(str), format="%Y")
+
+
+def _fractional_years(dates):
+    # 1 January is the year itself, so yearly rows line up with the forecast.
+    return (dates.dt.year + (dates.dt.dayofyear - 1) / (365 + dates.dt.is_leap_year)).to_numpy()
+
+
+def yearly(market):
+    """(years, values) of the market series, one mean value per calendar year."""
+    revenue = market["revenue_usd_m"].groupby(_dates(market).dt.year.to_numpy()).mean()
+    return revenue.index.to_numpy(), revenue.to_numpy(dtype=float)
+
+
+def forecast_base_year(market):
+    """Year of the last reported (``actual``) row; later years get Monte Carlo bands."""
+    if "actual" not in market:
+        raise ValueError("market_growth has no 'actual' column marking reported rows (1) and projections (0)")
+    actual = market["actual"].to_numpy(dtype=bool)
+    if not actual.any():
+        raise ValueError("market_growth has no reported rows (actual=1) to start the forecast from")
+    return int(_dates(market).dt.year.to_numpy()[actual][-1])
+
+
+def default_scenario(data):
+    """Forecast scenario that reproduces the published projection as its median."""
+    market = data.market_growth
+    base_year = forecast_base_year(market)
+    years, revenue = yearly(market)
+    end = int(years.max())
+    if end <= base_year:
+        raise ValueError(f"market_growth has no projections after its last reported year {base_year}")
+    return forecast.Scenario(
+        base_year=base_year,
+        base=float(revenue[years == base_year][0]),
+        horizon=end - base_year,
+        cagr=round(cagr(years, revenue, base_year, end), 4),
+    )
+
+
+def market_growth_view(data, start=0, end=None, n_out=downsample.CHART_PIXEL_BUDGET, scenario=None):
+    """The market growth series reduced to the chart's pixel budget.
+
+    ``series`` is the revenue followed by the forecast bands for ``scenario``
+    (the default one if not given): P5, P95, P25, P75, aligned to the labels.
+    ``index`` holds the positions of the kept points in the full series and
+    ``total`` its length, so the page can ask for a finer window (see
+    Website.py) when the viewer zooms. Labels are the ``period`` column if the
+    table has one, else the year.
+    """
+    market = data.market_growth
+    y = market["revenue_usd_m"].to_numpy(dtype=float)
+    index = downsample.downsample(np.arange(len(y)), y, n_out, start=start, end=end)
+    kept = market.iloc[index]
+    times = _fractional_years(_dates(kept))
+    bands = forecast.simulate(scenario or default_scenario(data))
+    return {
+        "labels": kept["period" if "period" in kept else "year"].astype(str).tolist(),
+        "series": [y[index].tolist()] + [forecast.align(bands, times, p).tolist() for p in (5, 95, 25, 75)],
+        "index": index.tolist(),
+        "total": len(y),
+    }
+
+
+def chart_data(data, encoding=transport.CHART_ENCODING):
+    """Labels and series for the three charts.
+
+    Series are encoded for the page (see transport.py); ``encoding=None``
+    returns them as plain lists.
+    """
+    components = data.components
+    sentiment = data.consumer_sentiment
+    charts = {
+        "marketGrowthChart": market_growth_view(data),
+        "componentsChart": {
+            "labels": [f"{name} ({share:g}%)"
+                       for name, share in zip(components["component"], components["share_pct"])],
+            "series": [components["share_pct"].tolist()],
+        },
+        "consumerSentimentChart": {
+            "labels": sentiment["statement"].tolist(),
+            "series": [sentiment["india_pct"].tolist(), sentiment["global_pct"].tolist()],
+        },
+    }
+    if encoding is None:
+        return charts
+    return {chart_id: transport.encode_chart(chart, encoding) for chart_id, chart in charts.items()}
+
+
+def chart_data_json(data, encoding=transport.CHART_ENCODING):
+    # Safe to drop into a <script type="application/json"> block.
+    return json.dumps(chart_data(data, encoding), separators=(",", ":")).replace("</", "<\\/")
@@ -0,0 +1,147 @@
+# Real-user timings of the report.
+#
+# In component mode the page records Performance API timings - assets ready,
+# each chart's creation, each streamed section's arrival, the first
+# interaction and its input delay, long tasks - and sends them back in batches
+# through the component value (see templates/scripts.html). Website.py feeds
+# every new batch to `histograms`, which keeps one histogram per metric,
+# browser class, content version and chart (or section), and writes them to
+# build/rum/ after each batch:
+#
+#     metrics.prom  Prometheus text format, e.g. for node_exporter's textfile
+#                   collector (report_chart_render_ms_bucket{...,le="50"} 3)
+#     metrics.csv   metric, browser, version, chart, count, mean, p50, p95
+#
+# Percentiles are estimated from the buckets like Prometheus'
+# histogram_quantile, so they are only as fine as BUCKETS_MS.
+
+import csv
+import io
+import math
+import os
+import re
+import threading
+from pathlib import Path
+
+RUM_DIR = Path(__file__).resolve().parent / "build" / "rum"
+# Upper bounds in milliseconds; the last bucket is +Inf.
+BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+METRICS = {
+    "assets_ready": "Time from navigation start until the stylesheet and Chart.js are ready",
+    "page_load": "Time from navigation start to the end of the load event",
+    "chart_render": "Main-thread time to create one chart",
+    "section_attach": "Main-thread time to attach and wire up one streamed section",
+    "first_interaction": "Time from navigation start to the first click, tap or key press",
+    "first_input_delay": "Delay before the first interaction's handlers started",
+    "long_task": "Duration of a main-thread task longer than 50ms",
+}
+MAX_SAMPLES_PER_BATCH = 500
+
+_BROWSERS = (("edge", r"Edg/"), ("opera", r"OPR/"), ("samsung", r"SamsungBrowser/"),
+             ("chrome", r"Chrome/|CriOS/"), ("firefox", r"Firefox/|FxiOS/"), ("safari", r"Safari/"))
+
+
+def browser_class(user_agent):
+    """Coarse browser family and form factor, e.g. "chrome-mobile"."""
+    user_agent = user_agent or ""
+    family = next((name for name, pattern in _BROWSERS if re.search(pattern, user_agent)), "other")
+    form = "mobile" if re.search(r"Mobi|Android|iPhone|iPad", user_agent) else "desktop"
+    return f"{family}-{form}"
+
+
+class Histograms:
+    """Cumulative histograms of page timings, shared by every session."""
+
+    def __init__(self, buckets=BUCKETS_MS):
+        self.buckets = buckets
+        self._series = {}  # (metric, browser, version, chart) -> [bucket counts..., sum]
+        self._lock = threading.Lock()
+
+    def record(self, batch, version):
+        """Add one batch sent by the page; returns the number of samples kept.
+
+        Samples are ``[metric, milliseconds, chart]``; unknown metrics and
+        values that aren't finite, non-negative numbers are dropped.
+        """
+        browser = browser_class(batch.get("userAgent"))
+        kept = 0
+        with self._lock:
+            for sample in (batch.get("samples") or [])[:MAX_SAMPLES_PER_BATCH]:
+                try:
+                    metric, value, chart = sample
+                    value = float(value)
+                except (TypeError, ValueError):
+                    continue
+                if metric not in METRICS or not math.isfinite(value) or value < 0:
+                    continue
+                if not isinstance(chart, str) or not re.fullmatch(r"\w{0,64}", chart):
+                    continue  # a canvas id, or "" for page-level metrics
+                key = (metric, browser, version, chart)
+                series = self._series.setdefault(key, [0] * (len(self.buckets) + 2))
+                series[next((i for i, bound in enumerate(self.buckets) if value <= bound), len(self.buckets))] += 1
+                series[-1] += value
+                kept += 1
+        return kept
+
+    def _snapshot(self):
+        with self._lock:
+            return sorted((key, list(series)) for key, series in self._series.items())
+
+    def quantile(self, q, counts):
+        """Estimate of the ``q`` quantile from per-bucket ``counts``."""
+        total = sum(counts)
+        if not total:
+            return math.nan
+        rank = q * total
+        seen = 0
+        for i, count in enumerate(counts):
+            if seen + count >= rank and count:
+                lower = self.buckets[i - 1] if i else 0
+                if i == len(self.buckets):
+                    return float(lower)  # +Inf bucket: the highest finite bound
+                return lower + (self.buckets[i] - lower) * (rank - seen) / count
+            seen += count
+        return float(self.buckets[-1])
+
+    def prometheus_text(self):
+        lines = []
+        snapshot = self._snapshot()
+        for metric, help_text in METRICS.items():
+            name = f"report_{metric}_ms"
+            lines += [f"# HELP {name} {help_text}.", f"# TYPE {name} histogram"]
+            for (series_metric, browser, version, chart), series in snapshot:
+                if series_metric != metric:
+                    continue
+                labels = f'browser="{browser}",version="{version}"'
+                if chart:
+                    labels += f',chart="{chart}"'
+                cumulative = 0
+                for bound, count in zip(self.buckets + ("+Inf",), series[:-1]):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f"{name}_sum{{{labels}}} {series[-1]:g}")
+                lines.append(f"{name}_count{{{labels}}} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+    def csv_text(self):
+        out = io.StringIO()
+        writer = csv.writer(out)
+        writer.writerow(["metric", "browser", "version", "chart", "count", "mean_ms", "p50_ms", "p95_ms"])
+        for (metric, browser, version, chart), series in self._snapshot():
+            counts, total = series[:-1], series[-1]
+            n = sum(counts)
+            writer.writerow([metric, browser, version, chart, n, f"{total / n:.1f}",
+                             f"{self.quantile(0.5, counts):.1f}", f"{self.quantile(0.95, counts):.1f}"])
+        return out.getvalue()
+
+    def write(self, out_dir=RUM_DIR):
+        """Write metrics.prom and metrics.csv, replacing them atomically."""
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        for name, text in (("metrics.prom", self.prometheus_text()), ("metrics.csv", self.csv_text())):
+            tmp = out_dir / f".{name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            tmp.write_text(text, encoding="utf-8")
+            os.replace(tmp, out_dir / name)
+
+
+histograms = Histograms()
@@ -0,0 +1,233 @@
+# Full-text search index for the report, built with the page.
+#
+# Browser find can't see collapsed accordion items or hidden tab panes, so the
+# report ships its own search. At render time the section HTML is split into
+# searchable documents - each tab pane, accordion item, reference and the
+# remaining text of every section - and reduced to an inverted index that is
+# embedded in the page and queried there, with no server round-trip:
+#
+#     docs      [title, snippet, kind, key] per document; kind/key say how to
+#               reveal it ("tab"/pane name, "accordion"/item number,
+#               "ref"/element id, "section"/section id)
+#     terms     sorted terms, front-coded: each entry is the length of the
+#               prefix shared with the previous term (one base-36 digit)
+#               followed by the rest, entries joined by ","
+#     postings  per term, the ascending document numbers as base-36 gaps
+#               joined by ".", terms joined by ","
+#
+# `python search_index.py` prints the index size and a few sample queries.
+
+import functools
+import json
+import re
+from html.parser import HTMLParser
+
+SNIPPET_CHARS = 120
+# Front coding stores the shared prefix length in one base-36 digit.
+MAX_SHARED_PREFIX = 35
+
+_TOKEN = re.compile(r"\w+")
+_HEADINGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+_VOID = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+# Not prose: citation markers ([2]), scripts and styles. <template> content
+# (hidden tab panes, collapsed accordion bodies) is indexed like the rest.
+_SKIP = {"sup", "script", "style"}
+
+
+def tokenize(text):
+    """Lowercase terms of ``text``; the page splits queries the same way."""
+    return [term for term in _TOKEN.findall(text.lower()) if len(term) > 1 or term.isdigit()]
+
+
+class _Extractor(HTMLParser):
+    """Splits section HTML into documents (see the module comment)."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.documents = []
+        self._stack = []  # (tag, document started here, title started here, skipped)
+        self._units = []  # documents being filled, innermost last
+        self._accordions = 0
+        self._skip = 0
+        self._title = None
+
+    def _unit(self, tag, attrs):
+        classes = (attrs.get("class") or "").split()
+        if tag == "section":
+            return "section", attrs.get("id") or ""
+        if tag == "div" and "tab-pane" in classes:
+            return "tab", (attrs.get("id") or "").removesuffix("-content")
+        if tag == "div" and "accordion-item" in classes:
+            self._accordions += 1
+            return "accordion", self._accordions - 1
+        if tag == "li" and (attrs.get("id") or "").startswith("ref-"):
+            return "ref", attrs["id"]
+        return None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        unit = self._unit(tag, attrs)
+        if unit is not None:
+            kind, key = unit
+            title = f"Reference {key.removeprefix('ref-')}" if kind == "ref" else ""
+            self._units.append({"kind": kind, "key": key, "title": title, "text": []})
+        is_title = (self._units and not self._units[-1]["title"] and self._title is None
+                    and (tag in _HEADINGS or "accordion-header" in (attrs.get("class") or "").split()))
+        if is_title:
+            self._title = []
+        skipped = tag in _SKIP or "accordion-icon" in (attrs.get("class") or "").split()
+        self._skip += skipped
+        if tag not in _VOID:
+            self._stack.append((tag, unit is not None, is_title, skipped))
+
+    def handle_endtag(self, tag):
+        if not any(open_tag == tag for open_tag, *_ in self._stack):
+            return
+        while self._stack:
+            open_tag, started_unit, started_title, skipped = self._stack.pop()
+            self._skip -= skipped
+            if started_title:
+                self._units[-1]["title"] = " ".join("".join(self._title).split())
+                self._title = None
+            if started_unit:
+                self._close(self._units.pop())
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        if self._skip or not self._units:
+            return
+        self._units[-1]["text"].append(data)
+        if self._title is not None:
+            self._title.append(data)
+
+    def _close(self, unit):
+        text = " ".join(" ".join(unit["text"]).split())
+        if text:
+            self.documents.append((unit["title"] or text[:60], text, unit["kind"], unit["key"]))
+
+    def close(self):
+        super().close()
+        while self._units:
+            self._close(self._units.pop())
+
+
+def extract_documents(html):
+    """(title, text, kind, key) for every searchable part of ``html``."""
+    parser = _Extractor()
+    parser.feed(html)
+    parser.close()
+    return parser.documents
+
+
+@functools.lru_cache(maxsize=64)
+def _section_documents(html):
+    parser = _Extractor()
+    parser.feed(html)
+    parser.close()
+    return tuple(parser.documents), parser._accordions
+
+
+def section_documents(sections):
+    """extract_documents() of the concatenated ``sections``, extracting each
+    section once per distinct HTML.
+
+    Accordion items are numbered across the page, so each section's numbers
+    are shifted by the items in the sections before it.
+    """
+    documents, accordions = [], 0
+    for html in sections:
+        found, count = _section_documents(html)
+        documents.extend((title, text, kind, key + accordions if kind == "accordion" else key)
+                         for title, text, kind, key in found)
+        accordions += count
+    return documents
+
+
+def _base36(number):
+    digits = "0123456789abcdefghijklmnopqrstuvwxyz"
+    out = ""
+    while True:
+        number, digit = divmod(number, 36)
+        out = digits[digit] + out
+        if not number:
+            return out
+
+
+def _snippet(text):
+    if len(text) <= SNIPPET_CHARS:
+        return text
+    return text[:SNIPPET_CHARS].rsplit(" ", 1)[0] + "…"
+
+
+@functools.lru_cache(maxsize=1024)
+def _terms(text):
+    return frozenset(tokenize(text))
+
+
+def build_index(documents):
+    postings = {}
+    for number, (_, text, _, _) in enumerate(documents):
+        for term in _terms(text):
+            postings.setdefault(term, []).append(number)
+    terms, encoded_postings = [], []
+    previous = ""
+    for term in sorted(postings):
+        shared = 0
+        limit = min(len(term), len(previous), MAX_SHARED_PREFIX)
+        while shared < limit and term[shared] == previous[shared]:
+            shared += 1
+        terms.append(_base36(shared) + term[shared:])
+        previous = term
+        numbers = postings[term]  # ascending: documents are visited in order
+        encoded_postings.append(".".join(_base36(b - a) for a, b in zip([0] + numbers, numbers)))
+    return {
+        "docs": [[title, _snippet(text), kind, key] for title, text, kind, key in documents],
+        "terms": ",".join(terms),
+        "postings": ",".join(encoded_postings),
+    }
+
+
+def search(index, query):
+    """Numbers of the documents matching every term of ``query`` as a prefix.
+
+    Decodes the index the way the page does; used to check it from Python.
+    """
+    terms, previous = [], ""
+    for entry in index["terms"].split(","):
+        previous = previous[:int(entry[0], 36)] + entry[1:]
+        terms.append(previous)
+    postings = index["postings"].split(",")
+    matches = None
+    for word in tokenize(query):
+        found = set()
+        for term, encoded in zip(terms, postings):
+            if term.startswith(word):
+                number = 0
+                for gap in encoded.split("."):
+                    number += int(gap, 36)
+                    found.add(number)
+        matches = found if matches is None else matches & found
+    return sorted(matches or ())
+
+
+def index_json(sections):
+    """The index of the section HTML strings ``sections``, in page order."""
+    # Safe to drop into a <script type="application/json"> block.
+    index = build_index(section_documents(sections))
+    return json.dumps(index, ensure_ascii=False, separators=(",", ":")).replace("</", "<\\/")
+
+
+if __name__ == "__main__":
+    import sys
+
+    import report
+
+    documents = extract_documents(report.build_html(head=""))
+    index = build_index(documents)
+    words = sum(len(tokenize(text)) for _, text, _, _ in documents)
+    print(f"{len(documents)} documents, {words:,} words, {index['terms'].count(',') + 1:,} terms")
+    print(f"index: {len(json.dumps(index, ensure_ascii=False)):,} bytes "
+          f"(terms {len(index['terms']):,}, postings {len(index['postings']):,})")
+    for query in sys.argv[1:] or ["myntra", "demand forecast", "upi"]:
+        print(f"{query!r}: {[documents[number][0] for number in search(index, query)]}")
@@ -0,0 +1,115 @@
+# Consumer sentiment from raw survey exports.
+#
+# The sentiment chart's percentages can be computed from respondent-level
+# survey exports instead of being typed in. Put the exports (one CSV per
+# survey wave, any number of rows) in data/<version>/survey/ with columns
+#
+#     region                  "India" or "Global"
+#     open_to_ai_purchase     1/0 (blank = not answered)
+#     trust_ai_deals          1/0
+#     open_to_chatbots        1/0
+#
+# Each file is streamed in bounded-memory chunks and reduced with vectorized
+# group-bys to per-region sums and answer counts. Those partial aggregates are
+# cached on disk per file, keyed on its size and mtime, so adding a new wave
+# only processes the new file. report_data.py reads the chart's numbers from
+# here whenever the survey folder exists.
+#
+#     python survey.py [data/v1/survey]   # aggregate and print the table
+
+import functools
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+CHUNK_ROWS = 250_000
+CACHE_DIR = Path(__file__).resolve().parent / "build" / "survey_cache"
+
+# Column -> statement shown on the chart, in chart order.
+QUESTIONS = {
+    "open_to_ai_purchase": "Open to AI for Purchase Decisions",
+    "trust_ai_deals": "Trust AI for Tailored Deals",
+    "open_to_chatbots": "Open to Chatbots",
+}
+REGIONS = {"India": "india_pct", "Global": "global_pct"}
+
+
+def aggregate_file(path, chunk_rows=CHUNK_ROWS):
+    """Per-region sums and answer counts for one export, streamed in chunks."""
+    sums = pd.DataFrame(0.0, index=list(REGIONS), columns=list(QUESTIONS))
+    counts = sums.copy()
+    chunks = pd.read_csv(path, usecols=["region", *QUESTIONS], chunksize=chunk_rows,
+                         dtype={"region": "category", **{column: "float32" for column in QUESTIONS}})
+    for chunk in chunks:
+        grouped = chunk.groupby("region", observed=True)[list(QUESTIONS)]
+        sums = sums.add(grouped.sum(), fill_value=0)
+        counts = counts.add(grouped.count(), fill_value=0)
+    return {"sums": sums.to_dict(), "counts": counts.to_dict()}
+
+
+def _cache_path(path):
+    return CACHE_DIR / (Path(path).resolve().as_posix().strip("/").replace("/", "__") + ".json")
+
+
+def cached_aggregate(path):
+    """aggregate_file() through the on-disk cache; returns (aggregate, hit)."""
+    stat = Path(path).stat()
+    key = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    cache = _cache_path(path)
+    try:
+        entry = json.loads(cache.read_text(encoding="utf-8"))
+        if entry["key"] == key:
+            return entry["aggregate"], True
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # missing, truncated or foreign entry: recompute and overwrite it
+    aggregate = aggregate_file(path)
+    cache.parent.mkdir(parents=True, exist_ok=True)
+    # Written aside and renamed, so a concurrent reader never sees half a file.
+    tmp = cache.with_name(f".{cache.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(json.dumps({"key": key, "aggregate": aggregate}), encoding="utf-8")
+    os.replace(tmp, cache)
+    return aggregate, False
+
+
+@functools.lru_cache(maxsize=8)
+def _combine(files):
+    sums = pd.DataFrame(0.0, index=list(REGIONS), columns=list(QUESTIONS))
+    counts = sums.copy()
+    for path, _, _ in files:
+        aggregate, _ = cached_aggregate(path)
+        sums = sums.add(pd.DataFrame(aggregate["sums"]), fill_value=0)
+        counts = counts.add(pd.DataFrame(aggregate["counts"]), fill_value=0)
+    pct = (100 * sums / counts.where(counts > 0)).round(1)
+    table = pct.T.rename(columns=REGIONS).rename(index=QUESTIONS)
+    return table.rename_axis("statement").reset_index()[["statement", *REGIONS.values()]]
+
+
+def survey_files(survey_dir):
+    return sorted(Path(survey_dir).glob("*.csv"))
+
+
+def consumer_sentiment(survey_dir):
+    """The consumer_sentiment table (statement, india_pct, global_pct).
+
+    Memoized on the set of export files and their size/mtime, so unchanged
+    inputs don't even touch the on-disk cache.
+    """
+    files = tuple((str(path), path.stat().st_size, path.stat().st_mtime_ns)
+                  for path in survey_files(survey_dir))
+    if not files:
+        raise FileNotFoundError(f"no survey exports (*.csv) in {survey_dir}")
+    return _combine(files)
+
+
+if __name__ == "__main__":
+    import report_data
+
+    survey_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else report_data.DATA_DIR / report_data.DATA_VERSION / "survey"
+    for path in survey_files(survey_dir):
+        _, hit = cached_aggregate(path)
+        print(f"{'cached' if hit else 'processed':>9}  {path}")
+    print(consumer_sentiment(survey_dir).to_string(index=False))
@@ -0,0 +1,57 @@
+# Encoding of chart series for the page.
+#
+# Each series travels as a string the page decodes on its own, so the cost of
+# every dataset can be measured and compared between encodings:
+#
+#     json  a JSON array literal, parsed number by number into a boxed array
+#     f32   base64 of little-endian Float32 values, decoded into a Float32Array
+#     f64   same with Float64 (exact, twice the size of f32)
+#
+# Gaps are NaN in the binary encodings and null in JSON; Chart.js skips both.
+# Integer arrays (the positions of downsampled points) use Int32 whenever a
+# binary encoding is selected. The page logs the size and decode time of each
+# dataset to the console (console.table) and keeps them in
+# window.reportDataStats. `python transport.py` prints the sizes per encoding.
+
+import base64
+import json
+import os
+
+import numpy as np
+
+ENCODINGS = ("json", "f32", "f64")
+CHART_ENCODING = os.environ.get("REPORT_CHART_ENCODING", "json")
+
+_DTYPES = {"f32": "<f4", "f64": "<f8", "i32": "<i4"}
+
+
+def encode_series(values, encoding=CHART_ENCODING, integer=False):
+    if encoding == "json":
+        # NaN (a gap, e.g. a forecast band outside its years) is not valid JSON.
+        values = [None if value != value else value for value in np.asarray(values).tolist()]
+        return {"encoding": "json", "data": json.dumps(values, separators=(",", ":"))}
+    if encoding not in _DTYPES:
+        raise ValueError(f"unknown chart encoding {encoding!r}, expected one of {ENCODINGS}")
+    if integer:
+        encoding = "i32"
+    data = np.ascontiguousarray(values, dtype=_DTYPES[encoding]).tobytes()
+    return {"encoding": encoding, "data": base64.b64encode(data).decode("ascii")}
+
+
+def encode_chart(chart, encoding=CHART_ENCODING):
+    """Copy of a chart payload with its series (and point index) encoded."""
+    encoded = dict(chart, series=[encode_series(values, encoding) for values in chart["series"]])
+    if "index" in chart:
+        encoded["index"] = encode_series(chart["index"], encoding, integer=True)
+    return encoded
+
+
+if __name__ == "__main__":
+    import report_data
+
+    charts = report_data.chart_data(report_data.load_report_data(), encoding=None)
+    print(f"{'dataset':32}" + "".join(f"{encoding:>10}" for encoding in ENCODINGS))
+    for chart_id, chart in charts.items():
+        for i, values in enumerate(chart["series"]):
+            sizes = [len(encode_series(values, encoding)["data"]) for encoding in ENCODINGS]
+            print(f"{f'{chart_id}[{i}] ({len(values)} pts)':32}" + "".join(f"{size:>10,}" for size in sizes))